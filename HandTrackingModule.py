@@ -1,6 +1,10 @@
 import cv2
 import numpy as np
 import math
+import queue
+import threading
+import time
+from types import SimpleNamespace
 
 try:
     import mediapipe as mp
@@ -9,14 +13,58 @@ except ImportError:
     print("MediaPipe not available. Please install: pip install mediapipe")
     MEDIAPIPE_AVAILABLE = False
 
+from _gesture_jit import (classify, GESTURE_NAMES, NUMBA_AVAILABLE, NO_HAND, VOLUME_CONTROL,
+                          OK, PEACE, MUTE, PREVIOUS, BRIGHTNESS, UNMUTE, UNKNOWN)
+
+# Bitmask fingers_up (thumb = bit 4 ... pinky = bit 0) yang gesturenya hanya
+# bergantung pada posisi jari: Volume Control, Peace, Mute (fist)
+_FINGER_ONLY_MASKS = frozenset((0b11000, 0b01100, 0b00000))
+
+# Pergeseran landmark maksimum (px) sejak klasifikasi terakhir yang masih
+# dianggap pose yang sama - gesture sebelumnya dipakai ulang tanpa klasifikasi
+_GESTURE_REUSE_PX = 3
+
+# Jumlah jari terangkat untuk setiap bitmask 5-bit
+_MASK_COUNT = tuple(bin(m).count("1") for m in range(32))
+
+def _put_latest(q, item):
+    """
+    Masukkan item ke queue 1-slot, buang item lama. Mengembalikan item yang dibuang
+    """
+    try:
+        stale = q.get_nowait()
+    except queue.Empty:
+        stale = None
+    q.put_nowait(item)
+    return stale
+
 class HandDetector:
     """
     Kelas untuk mendeteksi tangan yang dioptimalkan untuk performa
     """
     
-    def __init__(self, mode=False, max_hands=1, detection_confidence=0.5, tracking_confidence=0.5):
+    def __init__(self, mode=False, max_hands=1, detection_confidence=0.5, tracking_confidence=0.5,
+                 threaded=False, model_asset_path=None, no_hand_skip=3, ok_distance_threshold=60,
+                 use_opencl=False, motion_gate_threshold=0.0, motion_gate_max_age=0.25,
+                 detection_scale=0.5, model_complexity=1):
         """
         Inisialisasi hand detector
+        mode=False (video) membuat MediaPipe memakai ROI tangan dari frame sebelumnya
+        dan hanya menjalankan palm detection lagi saat tracking hilang
+        (tracking_confidence); mode=True menjalankan palm detection setiap frame
+        threaded=True menjalankan MediaPipe di background thread; find_hands
+        lalu memakai hasil terbaru yang tersedia (bisa dari frame sebelumnya)
+        model_asset_path (file hand_landmarker.task) mengaktifkan Tasks API
+        HandLandmarker dengan GPU delegate, fallback ke Solutions API
+        no_hand_skip=N menjalankan inference hanya 1 dari N frame saat tidak ada tangan
+        ok_distance_threshold adalah jarak maksimum thumb-index (px) untuk gesture OK
+        use_opencl=True menjalankan resize + cvtColor lewat cv2.UMat (OpenCL) jika ada
+        detection_scale adalah skala frame yang diberikan ke MediaPipe (landmark
+        ter-normalisasi, jadi otomatis valid di resolusi asli)
+        motion_gate_threshold > 0 melewati inference saat tangan ter-track dan rata-rata
+        absdiff 80x60 di area tangan di bawah threshold, maksimal motion_gate_max_age detik
+        model_complexity=0 memakai model landmark lite (lebih cepat di CPU,
+        akurasi sedikit lebih rendah), 1 memakai model full
         """
         if not MEDIAPIPE_AVAILABLE:
             print("ERROR: MediaPipe is required but not available")
@@ -28,16 +76,32 @@ class HandDetector:
         self.max_hands = max_hands
         self.detection_confidence = detection_confidence
         self.tracking_confidence = tracking_confidence
+        self.ok_distance_threshold = ok_distance_threshold
+        # Threshold kuadrat dihitung sekali, dibandingkan dengan jarak kuadrat per frame
+        self._ok_dist_sq = ok_distance_threshold * ok_distance_threshold
+        self.model_complexity = model_complexity
         
         try:
-            # Inisialisasi MediaPipe Hands
+            # Hasil inference asinkron (worker thread / callback HandLandmarker)
+            self._result_q = queue.Queue(maxsize=1)
+            
+            # Inisialisasi MediaPipe Hands - Tasks API jika model tersedia
             self.mp_hands = mp.solutions.hands
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=self.mode,
-                max_num_hands=self.max_hands,
-                min_detection_confidence=self.detection_confidence,
-                min_tracking_confidence=self.tracking_confidence
-            )
+            self._landmarker = None
+            self._timestamp_ms = 0
+            if model_asset_path:
+                self._landmarker = self._create_landmarker(model_asset_path)
+            
+            if self._landmarker is None:
+                self.hands = self.mp_hands.Hands(
+                    static_image_mode=self.mode,
+                    max_num_hands=self.max_hands,
+                    model_complexity=self.model_complexity,
+                    min_detection_confidence=self.detection_confidence,
+                    min_tracking_confidence=self.tracking_confidence
+                )
+            else:
+                self.hands = None
             
             self.mp_draw = mp.solutions.drawing_utils
             
@@ -50,15 +114,85 @@ class HandDetector:
             )
             
             self.results = None
+            self._result_timestamp = 0.0  # time.monotonic() saat hasil terakhir tiba
             self.landmarks_list = []
             
             # Landmark indices untuk jari-jari
             self.tip_ids = [4, 8, 12, 16, 20]
+
+            # Buffer persisten untuk koordinat landmark (normalized lalu pixel)
+            self._lm_xy = np.empty((21, 2), np.float32)
+            # Koordinat pixel muat di int16; selisih di-cast ke int sebelum dikuadratkan
+            self.landmarks_px = np.empty((21, 2), np.int16)
+            self._landmarks_valid = False
+            
+            if NUMBA_AVAILABLE:
+                # Compile (atau muat dari cache disk) kernel classify sekarang,
+                # bukan saat frame pertama yang berisi tangan
+                classify(np.zeros((21, 2), np.int16), self._ok_dist_sq)
+
+            # Index array konstan untuk fingers_up (tip vs pip, thumb tip vs ip)
+            self._tip_idx = np.array([8, 12, 16, 20], dtype=np.intp)
+            self._pip_idx = np.array([6, 10, 14, 18], dtype=np.intp)
+            self._thumb_tip = 4
+            self._thumb_ip = 3
             
             # Cache untuk optimasi
             self._last_hands = None
             self._frame_count = 0
             
+            # Cache per-frame untuk fingers_up dan detect_gesture
+            self._frame_id = 0
+            self._fingers_cache = None
+            self._gesture_frame = -1
+            self._gesture_cache = "No Hand"
+            self._prev_fmask = -1
+            self._prev_gesture = "Unknown"
+            # Landmark saat gesture terakhir diklasifikasi (anchor temporal coherence)
+            self._gesture_anchor = np.empty((21, 2), np.int16)
+            self._anchor_delta = np.empty((21, 2), np.int16)
+            
+            # Gating palm detection saat tidak ada tangan yang di-track
+            self._hand_present = False
+            self._no_hand_skip = max(1, no_hand_skip)
+            self._no_hand_counter = 0
+            
+            # Gating berbasis gerakan: pakai ulang hasil saat frame hampir diam
+            self._motion_gate_threshold = motion_gate_threshold
+            self._motion_gate_max_age = motion_gate_max_age
+            self._motion_bgr = np.empty((60, 80, 3), np.uint8)
+            self._motion_gray = np.empty((60, 80), np.uint8)
+            self._motion_prev = None
+            self._last_infer_time = 0.0
+            
+            # Sprite lingkaran pre-render per (radius, color) untuk titik landmark
+            self._sprites = {}
+            
+            # Buffer preprocessing, dialokasikan sekali saat frame pertama
+            self._small = None
+            self._rgb_buf = None
+            self.detection_scale = min(1.0, max(0.1, detection_scale))
+            
+            # Preprocessing di iGPU lewat OpenCL (T-API), hanya jika didukung
+            self.use_opencl = bool(use_opencl) and cv2.ocl.haveOpenCL()
+            if self.use_opencl:
+                cv2.ocl.setUseOpenCL(True)
+                print("OpenCL preprocessing enabled")
+            elif use_opencl:
+                print("OpenCL not available, using CPU preprocessing")
+            
+            # Inference di background thread (opsional, HandLandmarker sudah asinkron)
+            self.threaded = threaded and self._landmarker is None
+            self._worker = None
+            if self.threaded:
+                # 3 buffer RGB: satu diproses worker, satu di antrian, satu diisi
+                self._free_bufs = queue.Queue()
+                for _ in range(3):
+                    self._free_bufs.put(None)  # Dialokasikan saat frame pertama
+                self._infer_q = queue.Queue(maxsize=1)
+                self._worker = threading.Thread(target=self._infer_loop, daemon=True)
+                self._worker.start()
+            
             print("HandDetector initialized successfully")
             
         except Exception as e:
@@ -72,18 +206,39 @@ class HandDetector:
         if not self.available:
             return img
 
-        # Process every frame for better skeleton tracking
-        # Resize image untuk performa yang lebih baik
-        small_img = cv2.resize(img, (0, 0), fx=0.5, fy=0.5)
-        img_rgb = cv2.cvtColor(small_img, cv2.COLOR_BGR2RGB)
-        img_rgb.flags.writeable = False  # Optimasi memory
+        # Tanpa tangan: jalankan inference hanya 1 dari N frame untuk hemat CPU,
+        # dengan tangan: setiap frame agar tracking tetap responsif
+        if not self._hand_present:
+            self._no_hand_counter = (self._no_hand_counter + 1) % self._no_hand_skip
+            if self._no_hand_counter != 0:
+                return img
+
+        # Process every frame for better skeleton tracking, kecuali frame hampir diam
+        if self._motion_gate_threshold > 0 and self._is_static(img):
+            if self._landmarker is not None or self.threaded:
+                # Hasil yang sudah selesai tetap diambil; umurnya dibiarkan apa adanya
+                # karena frame yang masih diproses bisa menghasilkan hasil lebih baru
+                self._take_result()
+            else:
+                # Sinkron: tidak ada yang diproses, hasil sebelumnya sengaja dianggap
+                # valid untuk frame ini, jadi umurnya di-refresh untuk latest_result_age_ms
+                self._result_timestamp = time.monotonic()
+        elif self._landmarker is not None:
+            self._detect_async(img)
+            self._last_infer_time = time.monotonic()
+        elif self.threaded:
+            self._submit_frame(img)
+            self._last_infer_time = time.monotonic()
+        else:
+            self._rgb_buf = self._preprocess(img, self._rgb_buf)
+            self.results = self.hands.process(self._rgb_buf)
+            self._result_timestamp = self._last_infer_time = time.monotonic()
 
-        self.results = self.hands.process(img_rgb)
+        self._hand_present = bool(self.results and self.results.multi_hand_landmarks)
 
-        if self.results.multi_hand_landmarks and draw:
+        if self.results and self.results.multi_hand_landmarks and draw:
             for hand_landmarks in self.results.multi_hand_landmarks:
-                # Scale landmarks kembali ke ukuran asli
-                self._scale_landmarks(hand_landmarks, 2.0)
+                # Landmark ter-normalisasi [0,1], jadi langsung valid di resolusi asli
                 self.mp_draw.draw_landmarks(
                     img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
                     self.landmark_drawing_spec,
@@ -92,13 +247,205 @@ class HandDetector:
 
         return img
     
-    def _scale_landmarks(self, landmarks, scale_factor):
+    def _is_static(self, img):
+        """
+        True jika tangan ter-track, inference terakhir masih baru, dan area tangan
+        hampir sama dengan frame sebelumnya (mean absdiff grayscale 80x60 di dalam
+        bounding box tangan, supaya tangan kecil yang bergerak pelan tetap terdeteksi)
+        """
+        cv2.resize(img, (80, 60), dst=self._motion_bgr, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._motion_bgr, cv2.COLOR_BGR2GRAY, dst=self._motion_gray)
+        
+        prev = self._motion_prev
+        if prev is None:
+            self._motion_prev = self._motion_gray.copy()
+            return False
+        
+        diff = cv2.absdiff(self._motion_gray, prev, dst=prev)
+        # Tukar buffer: frame saat ini jadi referensi frame berikutnya
+        self._motion_prev, self._motion_gray = self._motion_gray, prev
+        
+        if not (self._hand_present
+                and time.monotonic() - self._last_infer_time < self._motion_gate_max_age):
+            return False
+        
+        x0, y0, x1, y1 = self._hand_roi_80x60()
+        return diff[y0:y1, x0:x1].mean() < self._motion_gate_threshold
+    
+    def _hand_roi_80x60(self):
+        """
+        Bounding box semua tangan dari hasil terakhir dalam koordinat grid 80x60,
+        ditambah margin 4 sel agar gerakan di tepi tangan ikut terhitung
+        """
+        xs = [lm.x for hand in self.results.multi_hand_landmarks for lm in hand.landmark]
+        ys = [lm.y for hand in self.results.multi_hand_landmarks for lm in hand.landmark]
+        x0 = min(79, max(0, int(min(xs) * 80) - 4))
+        y0 = min(59, max(0, int(min(ys) * 60) - 4))
+        x1 = max(x0 + 1, min(80, int(max(xs) * 80) + 5))
+        y1 = max(y0 + 1, min(60, int(max(ys) * 60) + 5))
+        return x0, y0, x1, y1
+    
+    def _create_landmarker(self, model_asset_path):
+        """
+        Buat HandLandmarker (Tasks API) mode LIVE_STREAM, coba GPU lalu CPU delegate
+        """
+        try:
+            from mediapipe.tasks import python as mp_tasks
+            from mediapipe.tasks.python import vision
+            from mediapipe.framework.formats import landmark_pb2
+        except ImportError as e:
+            print(f"MediaPipe Tasks API not available: {e}")
+            return None
+        
+        self._landmark_pb2 = landmark_pb2
+        
+        for delegate in (mp_tasks.BaseOptions.Delegate.GPU, mp_tasks.BaseOptions.Delegate.CPU):
+            try:
+                base_options = mp_tasks.BaseOptions(
+                    model_asset_path=model_asset_path, delegate=delegate
+                )
+                options = vision.HandLandmarkerOptions(
+                    base_options=base_options,
+                    running_mode=vision.RunningMode.LIVE_STREAM,
+                    num_hands=self.max_hands,
+                    min_hand_detection_confidence=self.detection_confidence,
+                    min_tracking_confidence=self.tracking_confidence,
+                    result_callback=self._on_landmarker_result
+                )
+                landmarker = vision.HandLandmarker.create_from_options(options)
+                print(f"HandLandmarker initialized with {delegate.name} delegate")
+                return landmarker
+            except Exception as e:
+                print(f"Could not create HandLandmarker with {delegate.name} delegate: {e}")
+        
+        return None
+    
+    def _on_landmarker_result(self, result, output_image, timestamp_ms):
+        """
+        Callback HandLandmarker - konversi ke format hasil Solutions API
+        """
+        landmark_pb2 = self._landmark_pb2
+        hands = []
+        for hand in result.hand_landmarks:
+            landmark_list = landmark_pb2.NormalizedLandmarkList()
+            landmark_list.landmark.extend(
+                landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z) for lm in hand
+            )
+            hands.append(landmark_list)
+        
+        _put_latest(self._result_q, (SimpleNamespace(multi_hand_landmarks=hands or None),
+                                     time.monotonic()))
+    
+    def _detect_async(self, img):
+        """
+        Kirim frame ke HandLandmarker dan ambil hasil terbaru dari callback
+        """
+        self._rgb_buf = self._preprocess(img, self._rgb_buf)
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buf)
+        
+        # detect_async butuh timestamp yang naik secara monoton
+        self._timestamp_ms = max(self._timestamp_ms + 1, int(time.monotonic() * 1000))
+        self._landmarker.detect_async(image, self._timestamp_ms)
+        
+        self._take_result()
+    
+    def _preprocess(self, img, dst):
+        """
+        Resize ke detection_scale dan konversi BGR->RGB ke buffer dst
+        """
+        # Resize image untuk performa yang lebih baik - ke buffer yang dipakai ulang
+        h, w = img.shape[:2]
+        sh, sw = int(h * self.detection_scale), int(w * self.detection_scale)
+        
+        if self.use_opencl:
+            # Resize dan konversi warna di GPU, hanya .get() yang kembali ke CPU
+            u_small = cv2.resize(cv2.UMat(img), (sw, sh), interpolation=cv2.INTER_AREA)
+            dst = cv2.cvtColor(u_small, cv2.COLOR_BGR2RGB).get()
+            dst.flags.writeable = False
+            return dst
+        
+        if (sh, sw) == (h, w):
+            small = img  # Skala penuh, tanpa resize
+        else:
+            if self._small is None or self._small.shape[:2] != (sh, sw):
+                self._small = np.empty((sh, sw, 3), np.uint8)
+            cv2.resize(img, (sw, sh), dst=self._small, interpolation=cv2.INTER_AREA)
+            small = self._small
+        
+        # Konversi BGR->RGB langsung ke buffer persisten, tanpa alokasi baru
+        if dst is None or dst.shape != small.shape:
+            dst = np.empty_like(small)
+        dst.flags.writeable = True
+        cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=dst)
+        
+        # Buffer C-contiguous dan read-only: MediaPipe bisa membaca langsung
+        # tanpa salinan defensif. Dibuat writeable lagi di frame berikutnya
+        assert dst.flags['C_CONTIGUOUS']
+        dst.flags.writeable = False
+        return dst
+    
+    def _take_result(self):
+        """
+        Ambil hasil inference terbaru dari worker/callback jika ada
+        """
+        try:
+            self.results, self._result_timestamp = self._result_q.get_nowait()
+        except queue.Empty:
+            pass  # Belum ada hasil baru, pakai hasil sebelumnya
+    
+    def _submit_frame(self, img):
         """
-        Scale landmarks setelah processing di resolusi rendah
+        Kirim frame ke worker thread dan ambil hasil inference terbaru
         """
-        for landmark in landmarks.landmark:
-            landmark.x *= scale_factor
-            landmark.y *= scale_factor
+        buf = self._preprocess(img, self._free_bufs.get())
+        stale = _put_latest(self._infer_q, buf)
+        if stale is not None:
+            self._free_bufs.put(stale)
+        
+        self._take_result()
+    
+    def _infer_loop(self):
+        """
+        Worker thread: jalankan MediaPipe pada frame terbaru di antrian
+        """
+        while True:
+            buf = self._infer_q.get()
+            if buf is None:
+                break
+            try:
+                results = self.hands.process(buf)
+            except Exception as e:
+                print(f"Error in inference worker: {e}")
+                results = None
+            finally:
+                self._free_bufs.put(buf)
+            
+            if results is not None:
+                _put_latest(self._result_q, (results, time.monotonic()))
+    
+    @property
+    def latest_result_age_ms(self):
+        """
+        Umur hasil inference terakhir dalam milidetik, untuk membuang landmark basi
+        """
+        return (time.monotonic() - self._result_timestamp) * 1000.0
+    
+    def close(self):
+        """
+        Hentikan worker thread dan lepaskan resource MediaPipe
+        """
+        if not self.available:
+            return
+        
+        if self._worker is not None:
+            _put_latest(self._infer_q, None)
+            self._worker.join(timeout=1.0)
+            self._worker = None
+        
+        if self._landmarker is not None:
+            self._landmarker.close()
+        else:
+            self.hands.close()
     
     def find_position(self, img, hand_number=0, draw=False):
         """
@@ -108,18 +455,38 @@ class HandDetector:
             return []
             
         self.landmarks_list = []
+        self._landmarks_valid = False
+        
+        # Frame baru - invalidate cache per-frame
+        self._frame_id += 1
+        self._fingers_cache = None
         
         if self.results and self.results.multi_hand_landmarks:
             if hand_number < len(self.results.multi_hand_landmarks):
                 hand = self.results.multi_hand_landmarks[hand_number]
                 h, w, c = img.shape
                 
-                for id, landmark in enumerate(hand.landmark):
-                    cx, cy = int(landmark.x * w), int(landmark.y * h)
-                    self.landmarks_list.append([id, cx, cy])
-                    
-                    if draw and id in self.tip_ids:  # Hanya gambar ujung jari
-                        cv2.circle(img, (cx, cy), 3, (255, 0, 255), cv2.FILLED)
+                # Loop ini tidak bisa dihindari karena landmark adalah protobuf field
+                lm_xy = self._lm_xy
+                for i, landmark in enumerate(hand.landmark):
+                    lm_xy[i, 0] = landmark.x
+                    lm_xy[i, 1] = landmark.y
+                
+                # Scaling ke pixel dalam satu operasi vectorized
+                np.multiply(lm_xy, (w, h), out=lm_xy)
+                # Bulatkan ke pixel terdekat (assignment int16 langsung memotong ke bawah)
+                np.rint(lm_xy, out=lm_xy)
+                self.landmarks_px[:] = lm_xy
+                self._landmarks_valid = True
+                
+                # landmarks_list (format lama) dibangun dari satu tolist(), bukan 42
+                # indexing numpy scalar; kode baru sebaiknya membaca landmarks_px
+                pix = self.landmarks_px
+                self.landmarks_list = [[i, x, y] for i, (x, y) in enumerate(pix.tolist())]
+                
+                if draw:  # Hanya gambar ujung jari
+                    for id in self.tip_ids:
+                        self._blit_circle(img, int(pix[id, 0]), int(pix[id, 1]), 3, (255, 0, 255))
         
         # Cache hasil untuk frame skip
         if self.results and self.results.multi_hand_landmarks:
@@ -131,130 +498,230 @@ class HandDetector:
         """
         Mendeteksi jari mana yang terangkat - dioptimalkan
         """
-        fingers = []
+        if not self._landmarks_valid:
+            return []
+        if self._fingers_cache is not None:
+            return self._fingers_cache
+        
+        lm = self.landmarks_px
+        
+        # 4 jari lainnya - tip di atas pip (y lebih kecil)
+        up4 = (lm[self._tip_idx, 1] < lm[self._pip_idx, 1]).astype(np.uint8)
         
-        if len(self.landmarks_list) < 21:
-            return fingers
-            
         # Thumb - simplified logic
-        if self.landmarks_list[self.tip_ids[0]][1] > self.landmarks_list[self.tip_ids[0]-1][1]:
-            fingers.append(1)
-        else:
-            fingers.append(0)
-            
-        # 4 jari lainnya - simplified
-        for id in range(1, 5):
-            if self.landmarks_list[self.tip_ids[id]][2] < self.landmarks_list[self.tip_ids[id]-2][2]:
-                fingers.append(1)
-            else:
-                fingers.append(0)
-                
-        return fingers
+        thumb = np.uint8(lm[self._thumb_tip, 0] > lm[self._thumb_ip, 0])
+        
+        self._fingers_cache = np.concatenate(([thumb], up4))
+        return self._fingers_cache
     
+    def get_point(self, idx):
+        """
+        Koordinat pixel (x, y) satu landmark, (0, 0) jika belum ada landmark
+        """
+        if not self._landmarks_valid:
+            return 0, 0
+        return int(self.landmarks_px[idx, 0]), int(self.landmarks_px[idx, 1])
+
     def find_distance(self, p1, p2, img=None, draw=True, color=(255, 0, 0), thickness=2):
         """
         Menghitung jarak antara dua landmark - dioptimalkan
         """
-        if len(self.landmarks_list) < max(p1, p2) + 1:
+        if not self._landmarks_valid:
             return 0, img, [0, 0, 0, 0, 0, 0]
             
-        x1, y1 = self.landmarks_list[p1][1], self.landmarks_list[p1][2]
-        x2, y2 = self.landmarks_list[p2][1], self.landmarks_list[p2][2]
+        x1, y1 = int(self.landmarks_px[p1, 0]), int(self.landmarks_px[p1, 1])
+        x2, y2 = int(self.landmarks_px[p2, 0]), int(self.landmarks_px[p2, 1])
         cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
         
         if draw and img is not None:
             cv2.line(img, (x1, y1), (x2, y2), color, thickness)
-            cv2.circle(img, (x1, y1), 4, color, cv2.FILLED)
-            cv2.circle(img, (x2, y2), 4, color, cv2.FILLED)
-            cv2.circle(img, (cx, cy), 4, color, cv2.FILLED)
+            self._blit_circle(img, x1, y1, 4, color)
+            self._blit_circle(img, x2, y2, 4, color)
+            self._blit_circle(img, cx, cy, 4, color)
             
         length = math.hypot(x2 - x1, y2 - y1)
         info = [x1, y1, x2, y2, cx, cy]
         
         return length, img, info
 
+    def _blit_circle(self, img, cx, cy, r, color):
+        """
+        Gambar lingkaran terisi dengan menyalin sprite yang di-cache ke ROI
+        """
+        key = (r, tuple(color))
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            size = 2 * r + 1
+            patch = np.zeros((size, size, 3), np.uint8)
+            cv2.circle(patch, (r, r), r, key[1], cv2.FILLED)
+            mask = np.zeros((size, size), np.uint8)
+            cv2.circle(mask, (r, r), r, 255, cv2.FILLED)
+            sprite = (patch, mask.astype(bool)[:, :, None])
+            self._sprites[key] = sprite
+        patch, mask = sprite
+        
+        # Clip sprite ke batas gambar
+        size = patch.shape[0]
+        h, w = img.shape[:2]
+        x0, y0 = cx - r, cy - r
+        sx0, sy0 = max(0, -x0), max(0, -y0)
+        sx1, sy1 = min(size, w - x0), min(size, h - y0)
+        if sx0 >= sx1 or sy0 >= sy1:
+            return
+        
+        roi = img[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1]
+        np.copyto(roi, patch[sy0:sy1, sx0:sx1], where=mask[sy0:sy1, sx0:sx1])
+
+    def distance2(self, p1, p2):
+        """
+        Jarak kuadrat antara dua landmark - tanpa sqrt dan tanpa alokasi tuple,
+        untuk perbandingan threshold. Pemanggil memastikan landmark tersedia
+        """
+        dx = int(self.landmarks_px[p1, 0]) - int(self.landmarks_px[p2, 0])
+        dy = int(self.landmarks_px[p1, 1]) - int(self.landmarks_px[p2, 1])
+        return dx * dx + dy * dy
+
     def detect_mute_gesture(self) -> str:
         """Detect mute gesture (closed fist)"""
-        if not self.landmarks_list or len(self.landmarks_list) < 21:
+        if not self._landmarks_valid:
             return "Unknown"
 
         fingers = self.fingers_up()
-        if not fingers:
-            return "Unknown"
 
         # All fingers down (closed fist)
-        if sum(fingers) == 0:
+        if int(fingers.sum()) == 0:
             return "Mute"
         return "Unknown"
 
     def detect_previous_gesture(self) -> str:
         """Detect previous track gesture (thumb down)"""
-        if not self.landmarks_list or len(self.landmarks_list) < 21:
+        if not self._landmarks_valid:
             return "Unknown"
 
         fingers = self.fingers_up()
-        if not fingers:
-            return "Unknown"
 
         # Only thumb down, others up (or thumb pointing down)
-        thumb_tip = self.landmarks_list[4]
-        thumb_base = self.landmarks_list[2]
+        lm_y = self.landmarks_px[:, 1]
 
         # Check if thumb is pointing down
-        if thumb_tip[2] > thumb_base[2] and sum(fingers[1:]) >= 3:  # Thumb down, others up
+        if lm_y[4] > lm_y[2] and int(fingers[1:].sum()) >= 3:  # Thumb down, others up
             return "Previous"
         return "Unknown"
 
     def detect_brightness_gesture(self) -> str:
         """Detect brightness control gesture (open palm)"""
-        if not self.landmarks_list or len(self.landmarks_list) < 21:
+        if not self._landmarks_valid:
             return "Unknown"
 
         fingers = self.fingers_up()
-        if not fingers:
-            return "Unknown"
 
         # All fingers up (open palm)
-        if sum(fingers) == 5:
+        if int(fingers.sum()) == 5:
             return "Brightness"
         return "Unknown"
 
+    def detect_unmute_gesture(self) -> str:
+        """Detect unmute gesture (open hand/palm spread)"""
+        if not self._landmarks_valid:
+            return "Unknown"
+
+        fingers = self.fingers_up()
+
+        # All fingers spread out (open hand) - similar to brightness but different context
+        # For unmute, we want a more relaxed open hand gesture
+        if int(fingers.sum()) >= 4:  # At least 4 fingers up (allowing some flexibility)
+            # Check if fingers are spread apart (not close together like OK gesture):
+            # index-middle dan middle-ring tip > 50 px, dibandingkan kuadrat tanpa sqrt
+            if self.distance2(8, 12) > 2500 and self.distance2(12, 16) > 2500:  # 50 px
+                return "Unmute"
+
+        return "Unknown"
+
     def detect_gesture(self):
         """
         Enhanced gesture detection with more gestures
         """
-        if not self.landmarks_list:
-            return "No Hand"
+        if self._gesture_frame == self._frame_id:
+            return self._gesture_cache
 
-        fingers = self.fingers_up()
-        if not fingers:
-            return "Unknown"
+        if self._landmarks_valid and self._prev_fmask >= 0 and self._near_anchor():
+            # Tangan hampir tidak bergerak sejak klasifikasi terakhir: pose sama
+            gesture = self._prev_gesture
+        elif self._landmarks_valid:
+            # Pola jari sama dengan frame sebelumnya dan gesture hanya bergantung
+            # pada pola jari: pakai hasil sebelumnya tanpa klasifikasi ulang
+            f = self.fingers_up().tolist()
+            fmask = (f[0] << 4) | (f[1] << 3) | (f[2] << 2) | (f[3] << 1) | f[4]
+            if fmask == self._prev_fmask and fmask in _FINGER_ONLY_MASKS:
+                gesture = self._prev_gesture
+            else:
+                gesture = self._classify_gesture(fmask)
+            self._prev_fmask = fmask
+            self._prev_gesture = gesture
+            self._gesture_anchor[:] = self.landmarks_px
+        else:
+            gesture = GESTURE_NAMES[NO_HAND]
+            self._prev_fmask = -1
+
+        self._gesture_frame = self._frame_id
+        self._gesture_cache = gesture
+        return gesture
+
+    def _near_anchor(self):
+        """
+        True jika semua landmark bergeser < _GESTURE_REUSE_PX dari anchor.
+        Anchor hanya diperbarui saat klasifikasi, jadi drift pelan tetap terdeteksi
+        """
+        delta = self._anchor_delta
+        np.subtract(self.landmarks_px, self._gesture_anchor, out=delta)
+        np.abs(delta, out=delta)
+        return int(delta.max()) < _GESTURE_REUSE_PX
+
+    def _classify_gesture(self, fmask):
+        """
+        Klasifikasi gesture dari landmark frame saat ini
+        Kedua jalur mengembalikan objek string dari GESTURE_NAMES, jadi
+        pencocokan di GestureHandler cukup lewat identitas
+        fmask adalah bitmask fingers_up (thumb = bit 4 ... pinky = bit 0)
+        """
+        if not self._landmarks_valid:
+            return GESTURE_NAMES[NO_HAND]
 
+        # Jalur cepat: kernel yang di-compile Numba
+        if NUMBA_AVAILABLE:
+            return GESTURE_NAMES[classify(self.landmarks_px, self._ok_dist_sq)]
+
+        # Jalur Python: satu branch tree, pola jari dicocokkan lewat bitmask
         # Volume Control Gesture (thumb and index up, others down)
-        if fingers[1] == 1 and fingers[0] == 1 and sum(fingers[2:]) == 0:
-            return "Volume Control"
+        if fmask == 0b11000:
+            return GESTURE_NAMES[VOLUME_CONTROL]
 
-        # OK Gesture
-        if fingers[1] == 1 and fingers[0] == 0 and sum(fingers[2:]) == 0:
-            distance, _, _ = self.find_distance(4, 8, draw=False)
-            if distance < 60:  # Increased threshold untuk stabil
-                return "OK"
+        # OK Gesture (index up only, thumb close to index tip)
+        if fmask == 0b01000 and self.distance2(4, 8) < self._ok_dist_sq:
+            return GESTURE_NAMES[OK]
 
         # Peace Gesture
-        if fingers[1] == 1 and fingers[2] == 1 and sum(fingers[3:]) == 0 and fingers[0] == 0:
-            return "Peace"
+        if fmask == 0b01100:
+            return GESTURE_NAMES[PEACE]
 
-        # New gestures
-        mute = self.detect_mute_gesture()
-        if mute != "Unknown":
-            return mute
+        # Mute: closed fist
+        if fmask == 0:
+            return GESTURE_NAMES[MUTE]
 
-        prev = self.detect_previous_gesture()
-        if prev != "Unknown":
-            return prev
+        # Previous, Brightness dan Unmute semuanya butuh >= 3 jari non-thumb terangkat
+        if _MASK_COUNT[fmask & 0b01111] < 3:
+            return GESTURE_NAMES[UNKNOWN]
 
-        bright = self.detect_brightness_gesture()
-        if bright != "Unknown":
-            return bright
+        # Previous: thumb pointing down, others up
+        if self.landmarks_px[4, 1] > self.landmarks_px[2, 1]:
+            return GESTURE_NAMES[PREVIOUS]
 
-        return "Unknown"
+        # Brightness: open palm
+        if fmask == 0b11111:
+            return GESTURE_NAMES[BRIGHTNESS]
+
+        # Unmute: open hand with index/middle/ring tips spread more than 50 px
+        if _MASK_COUNT[fmask] >= 4 and self.distance2(8, 12) > 2500 and self.distance2(12, 16) > 2500:
+            return GESTURE_NAMES[UNMUTE]
+
+        return GESTURE_NAMES[UNKNOWN]
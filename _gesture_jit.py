@@ -0,0 +1,91 @@
+"""
+Gesture classification kernel for HandDetector
+Compiled with Numba when available, plain Python otherwise
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Gesture codes returned by classify(), used as index into GESTURE_NAMES
+NO_HAND = 0
+VOLUME_CONTROL = 1
+OK = 2
+PEACE = 3
+MUTE = 4
+PREVIOUS = 5
+BRIGHTNESS = 6
+UNMUTE = 7
+UNKNOWN = 8
+
+GESTURE_NAMES = (
+    "No Hand",
+    "Volume Control",
+    "OK",
+    "Peace",
+    "Mute",
+    "Previous",
+    "Brightness",
+    "Unmute",
+    "Unknown",
+)
+
+@njit(cache=True, fastmath=True)
+def classify(lm, ok_dist_sq):
+    """
+    Classify a (21, 2) pixel landmark array into a gesture code.
+    ok_dist_sq is the squared thumb-index distance threshold for OK.
+    """
+    thumb = 1 if lm[4, 0] > lm[3, 0] else 0
+    index = 1 if lm[8, 1] < lm[6, 1] else 0
+    middle = 1 if lm[12, 1] < lm[10, 1] else 0
+    ring = 1 if lm[16, 1] < lm[14, 1] else 0
+    pinky = 1 if lm[20, 1] < lm[18, 1] else 0
+    others = middle + ring + pinky
+
+    # Volume Control Gesture (thumb and index up, others down)
+    if index == 1 and thumb == 1 and others == 0:
+        return VOLUME_CONTROL
+
+    # OK Gesture
+    if index == 1 and thumb == 0 and others == 0:
+        dx = int(lm[4, 0]) - int(lm[8, 0])
+        dy = int(lm[4, 1]) - int(lm[8, 1])
+        if dx * dx + dy * dy < ok_dist_sq:
+            return OK
+
+    # Peace Gesture
+    if index == 1 and middle == 1 and ring + pinky == 0 and thumb == 0:
+        return PEACE
+
+    # Closed fist
+    if thumb + index + others == 0:
+        return MUTE
+
+    # Thumb pointing down, others up
+    if lm[4, 1] > lm[2, 1] and index + others >= 3:
+        return PREVIOUS
+
+    # Open palm
+    if thumb + index + others == 5:
+        return BRIGHTNESS
+
+    # Open hand with index/middle/ring tips spread more than 50 px apart
+    if thumb + index + others >= 4:
+        dx = int(lm[8, 0]) - int(lm[12, 0])
+        dy = int(lm[8, 1]) - int(lm[12, 1])
+        if dx * dx + dy * dy > 2500:
+            dx = int(lm[12, 0]) - int(lm[16, 0])
+            dy = int(lm[12, 1]) - int(lm[16, 1])
+            if dx * dx + dy * dy > 2500:
+                return UNMUTE
+
+    return UNKNOWN
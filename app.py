@@ -12,11 +12,16 @@ import os
 from typing import Optional, Dict, Any
 from config import config
 from ui.ui_display import UIDisplay
-from services.gesture_handler import GestureHandler
+from services.gesture_handler import GestureHandler, GestureInfo
 from services.VolumeController import VolumeController
+from services.camera_thread import CameraThread
 from HandTrackingModule import HandDetector
 from utils.performance_optimizer import PerformanceOptimizer
 
+# cv2.pollKey (OpenCV >= 4.5.1) pumps HighGUI events without waitKey's 1 ms sleep;
+# the camera read already paces the loop
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
 class GestureMediaControlApp:
     """
     Main application class for Gesture Media Control
@@ -45,6 +50,11 @@ class GestureMediaControlApp:
         self.last_key_time = 0
         self.key_cooldown = 0.1  # 100ms cooldown
 
+        # Per-frame display settings, snapshotted in initialize()
+        self._headless = False
+        self._show_fps = True
+        self._status_suffix = "Press 'H' for help, 'Q' to quit"
+
     def initialize(self) -> bool:
         """
         Initialize all application components
@@ -67,6 +77,8 @@ class GestureMediaControlApp:
 
             # Initialize UI display
             self.ui_display = UIDisplay()
+            self._show_fps = config.get('ui.show_fps')
+            self._headless = config.get('ui.headless', False)
 
             # Initialize gesture handler
             self.gesture_handler = GestureHandler(self.volume_controller)
@@ -93,7 +105,10 @@ class GestureMediaControlApp:
                 print("✗ Could not open camera")
                 return False
 
-            # Set camera properties for performance
+            # Set camera properties for performance - pixel format before resolution/FPS
+            fourcc = config.get('camera.fourcc')
+            if fourcc:
+                self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
             self.camera.set(cv2.CAP_PROP_FPS, config.get('camera.fps'))
@@ -105,6 +120,10 @@ class GestureMediaControlApp:
                 print("✗ Could not read from camera")
                 return False
 
+            # Overlap capture with detection on a background thread
+            if config.get('camera.threaded_capture', True):
+                self.camera = CameraThread(self.camera).start()
+
             print(f"✓ Camera initialized: {width}x{height}")
             return True
 
@@ -118,7 +137,14 @@ class GestureMediaControlApp:
             self.detector = HandDetector(
                 detection_confidence=0.6,
                 tracking_confidence=0.5,
-                max_hands=1
+                max_hands=1,
+                threaded=config.get('performance.threaded_inference', False),
+                model_asset_path=config.get('performance.hand_landmarker_model'),
+                ok_distance_threshold=config.get('gestures.ok_distance_threshold'),
+                use_opencl=config.get('performance.use_opencl', False),
+                motion_gate_threshold=config.get('performance.motion_gate_threshold', 0.0),
+                detection_scale=config.get('performance.detection_scale', 0.5),
+                model_complexity=config.get('performance.model_complexity', 0)
             )
 
             if not self.detector.available:
@@ -186,12 +212,15 @@ class GestureMediaControlApp:
             print("Failed to read from camera")
             return False
 
-        # Flip image for mirror effect
-        img = cv2.flip(img, 1)
+        # Flip image for mirror effect - in place, the frame is owned by this loop
+        cv2.flip(img, 1, dst=img)
 
-        # Calculate FPS
-        self.current_time = time.time()
-        self.fps = 1 / (self.current_time - self.prev_time) if self.prev_time > 0 else 0
+        # Calculate FPS as an exponential moving average, ignoring zero-length intervals
+        self.current_time = time.monotonic()
+        dt = self.current_time - self.prev_time
+        if self.prev_time > 0 and dt > 1e-6:
+            instant_fps = 1.0 / dt
+            self.fps = 0.9 * self.fps + 0.1 * instant_fps if self.fps else instant_fps
         self.prev_time = self.current_time
 
         # Process hand detection every frame for smooth skeleton tracking
@@ -200,6 +229,11 @@ class GestureMediaControlApp:
 
         # Handle gestures (use performance optimizer for volume updates if needed)
         gesture_info = self.gesture_handler.detect_and_handle_gesture(img)
+        self.volume_controller.flush()
+
+        # Headless: no overlays, window or keyboard - stop with Ctrl+C
+        if self._headless:
+            return True
 
         # Update UI
         self._update_display(img, gesture_info)
@@ -213,72 +247,75 @@ class GestureMediaControlApp:
 
         return True
 
-    def _update_display(self, img: np.ndarray, gesture_info: Dict[str, Any]) -> None:
+    def _update_display(self, img: np.ndarray, gesture_info: GestureInfo) -> None:
         """Update all display elements"""
+        ui = self.ui_display
+        fps = self.fps
+        gesture = gesture_info.gesture
+
         # Update pulse animation
-        pulse_animation = self.ui_display.update_pulse_animation()
+        pulse_animation = ui.update_pulse_animation()
 
         # Get current volume for display
         current_volume = self.volume_controller.get_volume()
 
         # Draw UI elements
-        self.ui_display.draw_fps_display(img, self.fps)
-        self.ui_display.draw_volume_display(img, current_volume, None)  # TODO: Pass smooth bar
-        self.ui_display.draw_gesture_status(img, gesture_info["gesture"])
+        ui.draw_fps_display(img, fps)
+        ui.draw_volume_display(img, current_volume, None)  # TODO: Pass smooth bar
+        ui.draw_gesture_status(img, gesture)
 
         # Draw gesture-specific information
-        if gesture_info["gesture"] == "Volume Control" and "details" in gesture_info:
-            details = gesture_info["details"]
-            if "volume_distance" in details:
-                self.ui_display.draw_volume_control_info(
-                    img, details["volume_distance"], details.get("volume_set", current_volume)
-                )
+        if gesture == "Volume Control" and gesture_info.volume_distance is not None:
+            ui.draw_volume_control_info(img, gesture_info.volume_distance, gesture_info.volume_set)
 
         # Draw gesture feedback for discrete actions
-        if gesture_info.get("action_taken") and "discrete_action" in gesture_info.get("details", {}):
+        discrete_action = gesture_info.discrete_action
+        if gesture_info.action_taken and discrete_action:
             center_y = img.shape[0] // 2
-            self.ui_display.draw_gesture_feedback(img, gesture_info["details"]["discrete_action"], (0, center_y))
+            ui.draw_gesture_feedback(img, discrete_action, (0, center_y))
 
         # Draw animated volume bar
         # Draw hand skeleton overlay
-        self.ui_display.draw_hand_skeleton(img, self.detector)
-        self.ui_display.draw_animated_volume_bar(img, current_volume, current_volume, pulse_animation)
+        ui.draw_hand_skeleton(img, self.detector)
+        ui.draw_animated_volume_bar(img, current_volume, current_volume, pulse_animation)
 
         # Draw overlays
-        self.ui_display.draw_help_overlay(img, self.show_help)
+        ui.draw_help_overlay(img, self.show_help)
 
         # Draw performance overlay
         if self.show_performance:
+            has_history = bool(ui.fps_history)
             metrics = {
-                "fps": self.fps,
-                "avg_fps": self.ui_display.fps_history[-1] if self.ui_display.fps_history else self.fps,
-                "min_fps": min(self.ui_display.fps_history) if self.ui_display.fps_history else self.fps,
+                "fps": fps,
+                "avg_fps": ui.avg_fps if has_history else fps,
+                "min_fps": ui.min_fps if has_history else fps,
                 "cpu_usage": "N/A"  # TODO: Add CPU monitoring
             }
-            self.ui_display.draw_performance_overlay(img, metrics)
+            ui.draw_performance_overlay(img, metrics)
 
         # Draw status info
-        status_parts = []
-        if config.get('ui.show_fps'):
-            status_parts.append(f"FPS: {int(self.fps)}")
-        status_parts.append("Press 'H' for help, 'Q' to quit")
-        status_text = " | ".join(status_parts)
+        if self._show_fps:
+            status_text = f"FPS: {int(fps)} | {self._status_suffix}"
+        else:
+            status_text = self._status_suffix
 
-        self.ui_display.draw_status_info(img, status_text)
+        ui.draw_status_info(img, status_text)
 
     def _handle_keyboard_input(self) -> bool:
         """
         Handle keyboard input
         Returns False if application should exit
         """
-        current_time = time.time()
-        if current_time - self.last_key_time < self.key_cooldown:
-            return True
-
-        key = cv2.waitKey(1) & 0xFF
+        # Always pump the HighGUI event loop so imshow renders every frame
+        key = _poll_key() & 0xFF
         if key == ord('q') or key == 27:  # 'q' or ESC
             return False
 
+        # Cooldown only gates the toggle actions, not the key read
+        current_time = time.monotonic()
+        if current_time - self.last_key_time < self.key_cooldown:
+            return True
+
         # Handle other keys
         if key == ord('h'):  # Help toggle
             self.show_help = not self.show_help
@@ -286,6 +323,7 @@ class GestureMediaControlApp:
         elif key == ord('p'):  # Performance overlay toggle
             self.show_performance = not self.show_performance
             config.set('ui.show_performance_metrics', self.show_performance)
+            self.ui_display.reload_config()
             self.last_key_time = current_time
         elif key == ord('r'):  # Reset gesture state
             self.gesture_handler.reset_state()
@@ -328,6 +366,15 @@ class GestureMediaControlApp:
         if self.camera:
             self.camera.release()
 
+        if self.detector:
+            self.detector.close()
+
+        if self.gesture_handler:
+            self.gesture_handler.close()
+
+        if self.volume_controller:
+            self.volume_controller.close()
+
         cv2.destroyAllWindows()
 
         # Save configuration
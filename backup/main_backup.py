@@ -1,9 +1,30 @@
+import os
+import sys
 import cv2
 import numpy as np
 import time
 import math
+from functools import lru_cache
+
+# Tambahkan root project ke path agar script ini bisa dijalankan dari folder backup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from HandTrackingModule import HandDetector
-from VolumeController import VolumeController
+from services.VolumeController import VolumeController
+from services.camera_thread import CameraThread
+
+# cv2.pollKey (OpenCV >= 4.5.1) memproses event GUI tanpa sleep 1 ms milik waitKey,
+# tempo loop sudah diatur oleh camera thread
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
+# Pemetaan linear jarak thumb-index (px) ke volume (%)
+VOLUME_MIN_DIST = 30
+VOLUME_MAX_DIST = 200
+VOLUME_SCALE = 100.0 / (VOLUME_MAX_DIST - VOLUME_MIN_DIST)
+
+# Tabel sinus 256 langkah untuk animasi pulse, di-index dengan phase integer
+SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+PULSE_PHASE_STEP = 12  # ~0.3 rad per langkah animasi
 
 class PerformanceOptimizer:
     """
@@ -12,7 +33,7 @@ class PerformanceOptimizer:
     def __init__(self):
         self.frame_skip = 2  # Process setiap 2 frame
         self.frame_count = 0
-        self.last_volume_update = 0
+        self.last_volume_update = float('-inf')
         self.volume_update_interval = 0.05  # Update volume setiap 50ms
         
     def should_process_frame(self):
@@ -20,9 +41,12 @@ class PerformanceOptimizer:
         self.frame_count += 1
         return self.frame_count % self.frame_skip == 0
     
-    def should_update_volume(self):
-        """Decision apakah volume harus diupdate"""
-        current_time = time.time()
+    def should_update_volume(self, now=None):
+        """
+        Decision apakah volume harus diupdate
+        now: timestamp time.perf_counter() frame ini (diambil sendiri jika None)
+        """
+        current_time = time.perf_counter() if now is None else now
         if current_time - self.last_volume_update > self.volume_update_interval:
             self.last_volume_update = current_time
             return True
@@ -33,31 +57,24 @@ class SmoothVolumeBar:
     Class untuk animasi smooth volume bar
     """
     def __init__(self, animation_speed=0.2):
-        self.animation_speed = animation_speed
+        self.animation_speed = animation_speed  # Alpha EMA per frame (~30 FPS)
         self.display_volume = 0  # Volume yang ditampilkan (dengan animasi)
         self.target_volume = 0   # Volume target (aktual)
-        self.last_update_time = time.time()
         
     def update(self, target_volume):
         """
         Update volume bar dengan animasi smooth
+        EMA rasio tetap per frame - tanpa time.time() dan delta time
         """
         self.target_volume = target_volume
-        current_time = time.time()
-        delta_time = current_time - self.last_update_time
-        self.last_update_time = current_time
         
-        # Smooth animation menggunakan linear interpolation
-        if abs(self.display_volume - self.target_volume) > 0.5:
-            # Calculate step based on animation speed and delta time
-            step = (self.target_volume - self.display_volume) * self.animation_speed * delta_time * 60
-            self.display_volume += step
-            
-            # Clamp to target if very close
-            if abs(self.display_volume - self.target_volume) < 1:
-                self.display_volume = self.target_volume
+        # Smooth animation: display += alpha * (target - display)
+        diff = target_volume - self.display_volume
+        if -0.5 < diff < 0.5:
+            # Snap ke target jika sudah sangat dekat
+            self.display_volume = target_volume
         else:
-            self.display_volume = self.target_volume
+            self.display_volume += self.animation_speed * diff
             
         return int(self.display_volume)
     
@@ -79,16 +96,32 @@ def main():
         return
     
     # Set camera properties untuk performa
+    # MJPG: kamera mengirim frame terkompresi, tidak membebani bandwidth USB seperti YUYV
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, w_cam)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h_cam)
     cap.set(cv2.CAP_PROP_FPS, 30)
     cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    if cap.get(cv2.CAP_PROP_BUFFERSIZE) != 1:
+        # Backend mengabaikan BUFFERSIZE (mis. DirectShow) - capture thread tetap
+        # men-drain antrian driver dan hanya menyimpan frame terbaru
+        print("Camera backend ignored CAP_PROP_BUFFERSIZE=1, relying on capture thread drain")
+    
+    # Buang frame basi yang sudah terantri sejak kamera dibuka (~50 ms)
+    flush_until = time.monotonic() + 0.05
+    while time.monotonic() < flush_until and cap.grab():
+        pass
     
     # Inisialisasi detector tangan yang dioptimalkan
+    # mode=False: palm detection hanya saat tracking hilang, frame lain cukup
+    # landmark refinement dari ROI frame sebelumnya
     detector = HandDetector(
-        detection_confidence=0.6,
+        mode=False,
+        model_complexity=0,  # Model landmark lite, ~2x lebih cepat di CPU
+        detection_confidence=0.5,  # Tracking mode memakai ulang deteksi sebelumnya
         tracking_confidence=0.5,
-        max_hands=1
+        max_hands=1,
+        threaded=True  # MediaPipe di worker thread, loop ini memakai hasil terbaru
     )
     
     # Check if hand detector is available
@@ -97,6 +130,10 @@ def main():
         cap.release()
         return
     
+    # Capture di background thread: cap.read() tidak lagi memblokir inference.
+    # Frame yang tidak sempat dibaca loop ini hanya di-grab, tanpa decode
+    camera = CameraThread(cap, lazy_decode=True).start()
+    
     # Inisialisasi volume controller
     volume_controller = VolumeController()
     
@@ -105,17 +142,19 @@ def main():
     
     # Inisialisasi smooth volume bar
     smooth_bar = SmoothVolumeBar(animation_speed=0.3)  # Speed bisa diatur 0.1-0.5
+    volume_bar = AnimatedVolumeBar()
     
-    # Variabel untuk FPS calculation
-    prev_time = 0
+    # Variabel untuk FPS calculation (time.perf_counter, monotonic)
+    prev_time = None
     current_time = 0
     
     # Variabel untuk smoothing volume
     smooth_volume = volume_controller.get_volume()
     smoothing_factor = 0.3
+    last_set_volume = None  # Nilai integer terakhir yang dikirim ke volume controller
     
     # Variabel untuk gesture control
-    last_gesture_time = 0
+    last_gesture_time = float('-inf')
     gesture_cooldown = 1.0
     
     # Optimasi: Predefine colors dan fonts
@@ -132,14 +171,26 @@ def main():
     FONT_SCALE_MEDIUM = 0.6
     FONT_THICKNESS = 1
     
+    # Ukuran teks feedback gesture tetap - hitung sekali, bukan per frame
+    PLAY_SIZE = cv2.getTextSize("PLAY/PAUSE", FONT, FONT_SCALE_MEDIUM, FONT_THICKNESS)[0]
+    NEXT_SIZE = cv2.getTextSize("NEXT TRACK", FONT, FONT_SCALE_MEDIUM, FONT_THICKNESS)[0]
+    
+    # Label HUD yang di-cache, di-render ulang hanya saat teksnya berubah
+    fps_label = HudLabel((10, 25), FONT_SCALE_MEDIUM, FONT_THICKNESS, FONT)
+    volume_label = HudLabel((10, h_cam - 20), FONT_SCALE_MEDIUM, FONT_THICKNESS, FONT)
+    gesture_label = HudLabel((10, 50), FONT_SCALE_MEDIUM, FONT_THICKNESS, FONT)
+    
+    # Buffer output flip dipakai ulang - tanpa alokasi frame baru tiap iterasi
+    flipped = np.empty((h_cam, w_cam, 3), dtype=np.uint8)
+    
     # Variabel untuk efek visual
-    pulse_animation = 0
-    last_pulse_time = time.time()
+    pulse_phase = 0  # Index ke SIN_LUT
+    last_pulse_time = time.perf_counter()
     
     print("Gesture-Controlled Media System (Optimized + Smooth Animation) Started!")
     print("Optimizations applied:")
     print("- Lower resolution (640x480)")
-    print("- Frame skipping (process every 2nd frame)")
+    print("- MediaPipe inference on a worker thread")
     print("- Smooth volume bar animation")
     print("- Optimized volume update frequency")
     print()
@@ -150,27 +201,29 @@ def main():
     print("- Press 'q' or ESC to exit")
     
     while True:
-        # Baca frame dari kamera
-        success, img = cap.read()
+        # Ambil frame terbaru dari capture thread
+        success, img = camera.read()
         if not success:
             print("Failed to read from camera")
             break
             
-        # Flip gambar horizontal untuk mirror effect
-        img = cv2.flip(img, 1)
+        # Flip gambar horizontal untuk mirror effect ke buffer yang sama tiap frame
+        if flipped.shape != img.shape:
+            # Kamera tidak menghormati resolusi yang diminta
+            flipped = np.empty_like(img)
+        cv2.flip(img, 1, dst=flipped)
+        img = flipped
         
-        # Optimasi: Skip processing untuk beberapa frame
-        if perf_optimizer.should_process_frame():
-            # Deteksi tangan (hanya di frame yang diproses)
-            img = detector.find_hands(img)
-            landmarks_list = detector.find_position(img, draw=False)
-        else:
-            # Gunakan landmarks dari frame sebelumnya
-            landmarks_list = detector.landmarks_list
+        # Kirim frame ke inference worker dan pakai landmark terbaru yang tersedia,
+        # loop UI tidak menunggu MediaPipe sehingga frame skipping tidak diperlukan
+        detector.find_hands(img)
+        landmarks_list = detector.find_position(img, draw=False)
+        
+        # Satu timestamp per frame untuk FPS, animasi, throttle volume dan cooldown
+        current_time = time.perf_counter()
         
         # Hitung dan tampilkan FPS (selalu update)
-        current_time = time.time()
-        fps = 1 / (current_time - prev_time) if prev_time > 0 else 0
+        fps = 1 / (current_time - prev_time) if prev_time is not None and current_time > prev_time else 0
         prev_time = current_time
         
         # Update smooth volume bar animation
@@ -179,23 +232,20 @@ def main():
         # Update pulse animation untuk efek visual
         pulse_delta = current_time - last_pulse_time
         if pulse_delta > 0.05:  # 20 FPS untuk animasi
-            pulse_animation = (pulse_animation + 0.3) % (2 * math.pi)
+            pulse_phase = (pulse_phase + PULSE_PHASE_STEP) & 255
             last_pulse_time = current_time
         
         # Optimasi: Simple FPS display dengan warna berdasarkan performa
         fps_color = GREEN if fps > 20 else YELLOW if fps > 10 else RED
-        cv2.putText(img, f'FPS: {int(fps)}', (10, 25), 
-                   FONT, FONT_SCALE_MEDIUM, fps_color, FONT_THICKNESS)
+        fps_label.draw(img, f'FPS: {int(fps)}', fps_color)
         
         # Tampilkan volume dengan animasi
         volume_text_color = CYAN
-        cv2.putText(img, f'Volume: {display_volume}%', (10, h_cam - 20), 
-                   FONT, FONT_SCALE_MEDIUM, volume_text_color, FONT_THICKNESS)
+        volume_label.draw(img, f'Volume: {display_volume}%', volume_text_color)
         
         if landmarks_list:
             # Deteksi gesture
             gesture = detector.detect_gesture()
-            current_time = time.time()
             
             # Tampilkan gesture status dengan efek visual
             gesture_color = GREEN
@@ -206,29 +256,38 @@ def main():
             elif gesture == "Peace":
                 gesture_color = YELLOW
                 
-            cv2.putText(img, f'Gesture: {gesture}', (10, 50), 
-                       FONT, FONT_SCALE_MEDIUM, gesture_color, FONT_THICKNESS)
+            gesture_label.draw(img, f'Gesture: {gesture}', gesture_color)
             
             if gesture == "Volume Control":
                 # Kontrol volume dengan optimasi update frequency
-                length, img, info = detector.find_distance(4, 8, img, color=CYAN, thickness=2)
+                # Jarak langsung dari landmark, tanpa menggambar
+                x1, y1 = detector.get_point(4)
+                x2, y2 = detector.get_point(8)
+                length = math.hypot(x2 - x1, y2 - y1)
                 
-                # Konversi jarak ke volume
-                min_dist, max_dist = 30, 200
-                volume = np.interp(length, [min_dist, max_dist], [0, 100])
-                volume = max(0, min(100, volume))
+                # Konversi jarak ke volume - aritmatika skalar, tanpa np.interp
+                volume = (length - VOLUME_MIN_DIST) * VOLUME_SCALE
+                if volume < 0:
+                    volume = 0
+                elif volume > 100:
+                    volume = 100
                 
                 # Smoothing volume changes
-                smooth_volume = smooth_volume * (1 - smoothing_factor) + volume * smoothing_factor
+                smooth_volume += smoothing_factor * (volume - smooth_volume)
                 
-                # Optimasi: Update volume hanya pada interval tertentu
-                if perf_optimizer.should_update_volume():
-                    volume_controller.set_volume(int(smooth_volume))
+                # Optimasi: Update volume hanya jika nilai integer berubah dan
+                # interval update sudah lewat - tangan diam tidak memanggil backend
+                volume_int = int(smooth_volume)
+                if volume_int != last_set_volume and perf_optimizer.should_update_volume(current_time):
+                    volume_controller.set_volume(volume_int)
+                    last_set_volume = volume_int
                 
-                # Tampilkan informasi dengan efek visual
+                # Tampilkan garis dan informasi dengan efek visual, dilewati saat FPS rendah
                 if fps > 10:
+                    _, _, info = detector.find_distance(4, 8, img, color=CYAN, thickness=2)
+                    
                     # Efek pulse pada text informasi
-                    pulse_scale = 0.7 + 0.3 * math.sin(pulse_animation)
+                    pulse_scale = 0.7 + 0.3 * SIN_LUT[pulse_phase]
                     pulse_thickness = max(1, int(1 * pulse_scale))
                     
                     cv2.putText(img, f'Dist: {int(length)}px', (info[4]-40, info[5]-20), 
@@ -239,7 +298,7 @@ def main():
             elif gesture == "OK" and (current_time - last_gesture_time) > gesture_cooldown:
                 # Efek visual untuk gesture OK
                 gesture_text = "PLAY/PAUSE"
-                text_size = cv2.getTextSize(gesture_text, FONT, FONT_SCALE_MEDIUM, FONT_THICKNESS)[0]
+                text_size = PLAY_SIZE
                 text_x = (w_cam - text_size[0]) // 2
                 
                 # Background highlight
@@ -256,7 +315,7 @@ def main():
             elif gesture == "Peace" and (current_time - last_gesture_time) > gesture_cooldown:
                 # Efek visual untuk gesture Peace
                 gesture_text = "NEXT TRACK"
-                text_size = cv2.getTextSize(gesture_text, FONT, FONT_SCALE_MEDIUM, FONT_THICKNESS)[0]
+                text_size = NEXT_SIZE
                 text_x = (w_cam - text_size[0]) // 2
                 
                 # Background highlight
@@ -270,115 +329,240 @@ def main():
                 print("Next track triggered")
                 last_gesture_time = current_time
         
+        # Tulis perubahan volume yang ditahan VolumeController (coalescing)
+        volume_controller.flush()
+        
         # Gambar volume bar dengan animasi smooth
-        draw_animated_volume_bar(img, display_volume, smooth_bar.target_volume, pulse_animation)
+        volume_bar.draw(img, display_volume, smooth_bar.target_volume, pulse_phase)
         
         # Tampilkan frame
         cv2.imshow("Gesture Media Control (Smooth Animation)", img)
         
         # Exit dengan menekan 'q' atau ESC
-        key = cv2.waitKey(1) & 0xFF
+        key = _poll_key() & 0xFF
         if key == ord('q') or key == 27:
             break
     
     # Cleanup
-    cap.release()
+    camera.release()
+    detector.close()
+    # Tulis perubahan volume yang masih tertunda dan tutup helper amixer/osascript
+    volume_controller.close()
     cv2.destroyAllWindows()
     print("Application closed successfully")
 
-def draw_animated_volume_bar(img, display_volume, target_volume, pulse_animation, 
-                           bar_width=25, bar_height=250, margin=30):
+def _fill_colormap(low_volume):
     """
-    Volume bar dengan animasi smooth dan efek visual
+    Colormap user 256x1 (BGR) untuk applyColorMap, index = posisi relatif
+    baris dalam fill (0 = atas). low_volume: hijau ke kuning, lainnya: kuning ke merah
     """
-    h, w, _ = img.shape
-    
-    # Posisi volume bar
-    bar_x = margin
-    bar_y = (h - bar_height) // 2
-    
-    # Background bar dengan gradient
-    for i in range(bar_height):
-        ratio = i / bar_height
-        color_ratio = int(255 * ratio)
-        cv2.line(img, (bar_x, bar_y + i), (bar_x + bar_width, bar_y + i), 
-                (color_ratio//2, color_ratio//2, color_ratio//2), 1)
+    ratio = np.arange(256) / 256
+    lut = np.zeros((256, 1, 3), np.uint8)
+    if low_volume:
+        lut[:, 0, 1] = 255
+        lut[:, 0, 2] = np.clip((255 * (ratio * 2)).astype(np.int32), 0, 255)
+    else:
+        lut[:, 0, 1] = np.clip((255 * (1 - (ratio - 0.5) * 2)).astype(np.int32), 0, 255)
+        lut[:, 0, 2] = 255
+    return lut
+
+@lru_cache(maxsize=4)
+def _volume_bar_gradients(bar_height):
+    """
+    Precompute gradient volume bar: background (bar_height, 1, 3) dan
+    fill + highlight untuk setiap volume 0-100, siap di-broadcast ke lebar bar
+    """
+    # Background gradient abu-abu
+    rows = np.arange(bar_height)
+    gray = (255.0 * rows / bar_height).astype(np.int32) // 2
+    background = np.repeat(gray.astype(np.uint8)[:, None, None], 3, axis=2)
     
-    # Volume fill dengan animasi smooth
-    fill_height = int((display_volume / 100) * bar_height)
-    fill_y = bar_y + (bar_height - fill_height)
+    # Gradient dari hijau ke merah (BGR) lewat applyColorMap, tanpa loop per baris
+    low_lut, high_lut = _fill_colormap(True), _fill_colormap(False)
     
-    # Gradient color untuk volume fill
-    for i in range(fill_height):
-        ratio = i / fill_height if fill_height > 0 else 0
-        height_pos = fill_y + i
+    fills = []
+    for volume in range(101):
+        fill_height = int((volume / 100) * bar_height)
+        if fill_height == 0:
+            fills.append(np.zeros((0, 1, 3), np.uint8))  # applyColorMap menolak Mat kosong
+            continue
+        ramp = (np.arange(fill_height) * 256 // fill_height).astype(np.uint8)
+        fill = cv2.applyColorMap(ramp.reshape(-1, 1), low_lut if volume < 50 else high_lut)
         
-        # Gradient dari hijau ke merah
-        if display_volume < 50:
-            # Hijau ke kuning
-            green = 255
-            red = int(255 * (ratio * 2))
-            blue = 0
-        else:
-            # Kuning ke merah
-            green = int(255 * (1 - (ratio - 0.5) * 2))
-            red = 255
-            blue = 0
-            
-        color = (blue, green, red)
-        cv2.line(img, (bar_x, height_pos), (bar_x + bar_width, height_pos), color, 1)
-    
-    # Efek highlight pada bagian atas volume bar
-    if fill_height > 0:
+        # Efek highlight pada bagian atas volume bar
         highlight_height = max(3, fill_height // 10)
-        for i in range(highlight_height):
-            alpha = 1.0 - (i / highlight_height)
-            highlight_color = (int(255 * alpha), int(255 * alpha), int(255 * alpha))
-            pos = fill_y + i
-            if pos < bar_y + bar_height:
-                cv2.line(img, (bar_x, pos), (bar_x + bar_width, pos), highlight_color, 1)
+        top = min(highlight_height, fill_height)
+        fill[:top] = (255 * (1.0 - np.arange(top) / highlight_height)).astype(np.uint8)[:, None, None]
+        
+        fills.append(fill)
     
-    # Border bar dengan efek 3D
-    cv2.rectangle(img, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), 
-                 (100, 100, 100), 1)
-    cv2.rectangle(img, (bar_x-1, bar_y-1), (bar_x + bar_width + 1, bar_y + bar_height + 1), 
-                 (50, 50, 50), 1)
+    return background, tuple(fills)
+
+class HudLabel:
+    """
+    Label teks HUD dengan posisi tetap
+    Teks di-render ke sprite + mask hanya saat isi atau warna berubah,
+    frame lain cukup blit sprite yang sama
+    """
+    def __init__(self, org, font_scale, thickness=1, font=cv2.FONT_HERSHEY_SIMPLEX):
+        self.org = org
+        self.font = font
+        self.font_scale = font_scale
+        self.thickness = thickness
+        self._sprite = None       # (sprite, mask, x0, y0)
+        self._key = None          # (text, color) saat sprite dibuat
     
-    # Marker setiap 25%
-    for percent in [0, 25, 50, 75, 100]:
-        marker_y = bar_y + bar_height - int((percent / 100) * bar_height)
-        marker_color = (200, 200, 200) if percent % 50 == 0 else (150, 150, 150)
-        marker_length = 8 if percent % 50 == 0 else 5
-        
-        cv2.line(img, (bar_x - marker_length, marker_y), (bar_x, marker_y), 
-                marker_color, 1)
-        cv2.line(img, (bar_x + bar_width, marker_y), (bar_x + bar_width + marker_length, marker_y), 
-                marker_color, 1)
-        
-        # Text marker
-        if percent % 50 == 0:
-            text_offset = 15 if percent == 0 else 12
-            cv2.putText(img, f'{percent}%', 
-                       (bar_x + bar_width + 10, marker_y + 5), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.3, (200, 200, 200), 1)
+    def _render(self, text, color):
+        """Render teks ke sprite kecil dan mask-nya"""
+        (text_w, text_h), baseline = cv2.getTextSize(text, self.font, self.font_scale, self.thickness)
+        pad = self.thickness + 1
+        sprite_h = text_h + baseline + 2 * pad
+        sprite_w = text_w + 2 * pad
+        sprite = np.zeros((sprite_h, sprite_w, 3), np.uint8)
+        mask = np.zeros((sprite_h, sprite_w), np.uint8)
+        origin = (pad, pad + text_h)
+        cv2.putText(sprite, text, origin, self.font, self.font_scale, color, self.thickness)
+        cv2.putText(mask, text, origin, self.font, self.font_scale, 255, self.thickness)
+        x0 = max(0, self.org[0] - pad)
+        y0 = max(0, self.org[1] - text_h - pad)
+        return sprite, mask.astype(bool)[:, :, None], x0, y0
     
-    # Efek pulse pada target volume indicator
-    pulse_scale = 0.8 + 0.2 * math.sin(pulse_animation)
-    target_height = bar_y + bar_height - int((target_volume / 100) * bar_height)
-    pulse_size = int(3 * pulse_scale)
+    def draw(self, img, text, color):
+        """Blit label ke frame, render ulang hanya jika teks/warna berubah"""
+        key = (text, color)
+        if key != self._key:
+            self._sprite = self._render(text, color)
+            self._key = key
+        sprite, mask, x0, y0 = self._sprite
+        
+        sh, sw = sprite.shape[:2]
+        roi = img[y0:y0 + sh, x0:x0 + sw]
+        np.copyto(roi, sprite[:roi.shape[0], :roi.shape[1]], where=mask[:roi.shape[0], :roi.shape[1]])
+
+class AnimatedVolumeBar:
+    """
+    Volume bar dengan animasi smooth dan efek visual
+    Elemen statis (background, border, marker, label) di-render sekali ke sprite
+    """
+    def __init__(self, bar_width=25, bar_height=250, margin=30):
+        self.bar_width = bar_width
+        self.bar_height = bar_height
+        self.margin = margin
+        self._static = None       # (sprite, mask, x0, y0)
+        self._static_key = None   # Tinggi frame saat sprite dibuat
     
-    # Target indicator (garis kecil yang berdenyut)
-    if abs(display_volume - target_volume) > 2:  # Hanya show jika ada perbedaan
-        cv2.line(img, (bar_x - 5, target_height), (bar_x + bar_width + 5, target_height), 
-                (255, 255, 255), pulse_size)
+    def _render_static(self, bar_x, bar_y):
+        """
+        Render background gradient, border 3D, marker dan label persen ke sprite + mask
+        """
+        bar_width, bar_height = self.bar_width, self.bar_height
+        label_width = cv2.getTextSize('100%', cv2.FONT_HERSHEY_SIMPLEX, 0.3, 1)[0][0]
+        
+        # Area sprite: marker kiri (8px), label kanan, teks di atas/bawah bar
+        x0, y0 = bar_x - 10, bar_y - 12
+        sprite_w = bar_width + 10 + 10 + label_width + 4
+        sprite_h = bar_height + 24
+        sprite = np.zeros((sprite_h, sprite_w, 3), np.uint8)
+        mask = np.zeros((sprite_h, sprite_w), np.uint8)
+        bx, by = bar_x - x0, bar_y - y0
+        
+        def draw(func, *args, color, **kwargs):
+            # Gambar primitive yang sama ke sprite dan mask
+            func(sprite, *args, color, **kwargs)
+            func(mask, *args, 255, **kwargs)
+        
+        # Background bar dengan gradient
+        background, _ = _volume_bar_gradients(bar_height)
+        sprite[by:by + bar_height, bx:bx + bar_width + 1] = background
+        mask[by:by + bar_height, bx:bx + bar_width + 1] = 255
+        
+        # Border bar dengan efek 3D
+        draw(cv2.rectangle, (bx, by), (bx + bar_width, by + bar_height), color=(100, 100, 100), thickness=1)
+        draw(cv2.rectangle, (bx - 1, by - 1), (bx + bar_width + 1, by + bar_height + 1),
+             color=(50, 50, 50), thickness=1)
+        
+        # Marker setiap 25%
+        for percent in [0, 25, 50, 75, 100]:
+            marker_y = by + bar_height - int((percent / 100) * bar_height)
+            marker_color = (200, 200, 200) if percent % 50 == 0 else (150, 150, 150)
+            marker_length = 8 if percent % 50 == 0 else 5
+            
+            draw(cv2.line, (bx - marker_length, marker_y), (bx, marker_y), color=marker_color, thickness=1)
+            draw(cv2.line, (bx + bar_width, marker_y), (bx + bar_width + marker_length, marker_y),
+                 color=marker_color, thickness=1)
+            
+            # Text marker
+            if percent % 50 == 0:
+                draw(cv2.putText, f'{percent}%', (bx + bar_width + 10, marker_y + 5),
+                     cv2.FONT_HERSHEY_SIMPLEX, 0.3, color=(200, 200, 200), thickness=1)
+        
+        return sprite, mask, x0, y0
     
-    # Current volume indicator (bulat di ujung)
-    current_height = bar_y + bar_height - fill_height
-    indicator_radius = 4
-    cv2.circle(img, (bar_x + bar_width//2, current_height), 
-              indicator_radius, (255, 255, 255), -1)
-    cv2.circle(img, (bar_x + bar_width//2, current_height), 
-              indicator_radius, (0, 0, 0), 1)
+    def draw(self, img, display_volume, target_volume, pulse_phase):
+        """
+        Gambar volume bar: blit sprite statis, lalu fill dan indikator dinamis
+        """
+        h, w, _ = img.shape
+        bar_width, bar_height = self.bar_width, self.bar_height
+        
+        # Posisi volume bar
+        bar_x = self.margin
+        bar_y = (h - bar_height) // 2
+        
+        if self._static_key != h:
+            self._static = self._render_static(bar_x, bar_y)
+            self._static_key = h
+        sprite, mask, x0, y0 = self._static
+        
+        # Blit elemen statis, di-clip ke frame (y0/x0 bisa negatif di frame pendek,
+        # slice negatif akan wrap ke sisi lain gambar)
+        # cv2.copyTo dengan mask uint8: satu pass SIMD langsung ke ROI frame
+        sh, sw = sprite.shape[:2]
+        sx0, sy0 = max(0, -x0), max(0, -y0)
+        sx1, sy1 = min(sw, w - x0), min(sh, h - y0)
+        if sx0 < sx1 and sy0 < sy1:
+            roi = img[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1]
+            cv2.copyTo(sprite[sy0:sy1, sx0:sx1], mask[sy0:sy1, sx0:sx1], roi)
+        
+        # Volume fill (gradient + highlight) di dalam border, border tidak tertimpa
+        _, fills = _volume_bar_gradients(bar_height)
+        display_volume = max(0, min(100, int(display_volume)))
+        fill = fills[display_volume]
+        fill_height = len(fill)
+        fill_y = bar_y + (bar_height - fill_height)
+        top = max(fill_y, bar_y + 1, 0)
+        if fill_y + fill_height > top:
+            img[top:fill_y + fill_height, bar_x + 1:bar_x + bar_width] = fill[top - fill_y:]
+        
+        # Efek pulse pada target volume indicator
+        pulse_scale = 0.8 + 0.2 * SIN_LUT[pulse_phase & 255]
+        target_height = bar_y + bar_height - int((target_volume / 100) * bar_height)
+        pulse_size = int(3 * pulse_scale)
+        
+        # Target indicator (garis kecil yang berdenyut)
+        if abs(display_volume - target_volume) > 2:  # Hanya show jika ada perbedaan
+            cv2.line(img, (bar_x - 5, target_height), (bar_x + bar_width + 5, target_height), 
+                    (255, 255, 255), pulse_size)
+        
+        # Current volume indicator (bulat di ujung)
+        current_height = bar_y + bar_height - fill_height
+        indicator_radius = 4
+        cv2.circle(img, (bar_x + bar_width//2, current_height), 
+                  indicator_radius, (255, 255, 255), -1)
+        cv2.circle(img, (bar_x + bar_width//2, current_height), 
+                  indicator_radius, (0, 0, 0), 1)
+
+@lru_cache(maxsize=8)
+def _volume_bar_for(bar_width, bar_height, margin):
+    """Satu AnimatedVolumeBar per geometri, agar sprite statisnya tidak di-render ulang"""
+    return AnimatedVolumeBar(bar_width, bar_height, margin)
+
+def draw_animated_volume_bar(img, display_volume, target_volume, pulse_phase, 
+                           bar_width=25, bar_height=250, margin=30):
+    """
+    Volume bar dengan animasi smooth dan efek visual
+    """
+    _volume_bar_for(bar_width, bar_height, margin).draw(img, display_volume, target_volume, pulse_phase)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
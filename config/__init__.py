@@ -1 +1 @@
-from .config import config_instance as config, Colors, Fonts, UI, VolumeBar, Gestures
+from .config import config_instance as config, Colors, Fonts, UI, VolumeBar, Gestures, Performance
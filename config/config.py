@@ -3,8 +3,11 @@ Configuration file for Gesture Media Control
 Contains all constants, settings, and configuration management
 """
 
+import atexit
+import copy
 import json
 import os
+import threading
 from typing import Dict, Any, Tuple
 
 # Color definitions (BGR format for OpenCV)
@@ -41,6 +44,8 @@ class Camera:
     HEIGHT = 480
     FPS = 30
     BUFFER_SIZE = 1
+    THREADED_CAPTURE = True  # Grab frames on a background thread
+    FOURCC = "MJPG"  # Compressed USB transfer, empty string keeps the driver default
 
 # Performance settings
 class Performance:
@@ -49,6 +54,12 @@ class Performance:
     VOLUME_UPDATE_INTERVAL = 0.05  # seconds
     PULSE_ANIMATION_SPEED = 0.3
     SMOOTHING_FACTOR = 0.3
+    THREADED_INFERENCE = False  # Run MediaPipe on a background thread
+    HAND_LANDMARKER_MODEL = None  # Path to hand_landmarker.task (Tasks API, GPU delegate)
+    USE_OPENCL = False  # Resize/cvtColor via cv2.UMat when OpenCL is available
+    DETECTION_SCALE = 0.5  # Frame scale fed to MediaPipe (640x480 -> 320x240)
+    MOTION_GATE_THRESHOLD = 0.0  # Mean 80x60 diff over the hand box below which inference is reused (0 = off)
+    MODEL_COMPLEXITY = 0  # MediaPipe hand landmark model: 0 = lite (fastest on CPU), 1 = full
 
 # Gesture settings
 class Gestures:
@@ -57,6 +68,7 @@ class Gestures:
     VOLUME_MIN_DISTANCE = 30
     VOLUME_MAX_DISTANCE = 200
     GESTURE_COOLDOWN = 1.0  # seconds
+    MAX_LANDMARK_AGE_MS = 100  # ignore continuous control on older results
 
 # UI settings
 class UI:
@@ -85,32 +97,58 @@ class Config:
     """
 
     CONFIG_FILE = "gesture_config.json"
+    SAVE_DELAY = 1.0  # seconds to coalesce set() calls before writing to disk
+
+    # Color name -> BGR lookup for color settings
+    COLOR_MAP = {
+        "green": Colors.GREEN,
+        "red": Colors.RED,
+        "blue": Colors.BLUE,
+        "yellow": Colors.YELLOW,
+        "cyan": Colors.CYAN,
+        "orange": Colors.ORANGE,
+        "purple": Colors.PURPLE,
+        "pink": Colors.PINK,
+        "white": Colors.WHITE,
+        "gray": Colors.GRAY,
+        "black": Colors.BLACK
+    }
 
     # Default configuration
     DEFAULT_CONFIG = {
         "camera": {
             "width": Camera.WIDTH,
             "height": Camera.HEIGHT,
-            "fps": Camera.FPS
+            "fps": Camera.FPS,
+            "threaded_capture": Camera.THREADED_CAPTURE,
+            "fourcc": Camera.FOURCC
         },
         "performance": {
             "frame_skip": Performance.FRAME_SKIP,
             "volume_update_interval": Performance.VOLUME_UPDATE_INTERVAL,
             "pulse_animation_speed": Performance.PULSE_ANIMATION_SPEED,
-            "smoothing_factor": Performance.SMOOTHING_FACTOR
+            "smoothing_factor": Performance.SMOOTHING_FACTOR,
+            "threaded_inference": Performance.THREADED_INFERENCE,
+            "hand_landmarker_model": Performance.HAND_LANDMARKER_MODEL,
+            "use_opencl": Performance.USE_OPENCL,
+            "motion_gate_threshold": Performance.MOTION_GATE_THRESHOLD,
+            "detection_scale": Performance.DETECTION_SCALE,
+            "model_complexity": Performance.MODEL_COMPLEXITY
         },
         "gestures": {
             "ok_distance_threshold": Gestures.OK_DISTANCE_THRESHOLD,
             "volume_min_distance": Gestures.VOLUME_MIN_DISTANCE,
             "volume_max_distance": Gestures.VOLUME_MAX_DISTANCE,
-            "gesture_cooldown": Gestures.GESTURE_COOLDOWN
+            "gesture_cooldown": Gestures.GESTURE_COOLDOWN,
+            "max_landmark_age_ms": Gestures.MAX_LANDMARK_AGE_MS
         },
         "ui": {
             "volume_bar_width": UI.VOLUME_BAR_WIDTH,
             "volume_bar_height": UI.VOLUME_BAR_HEIGHT,
             "volume_bar_margin": UI.VOLUME_BAR_MARGIN,
             "show_fps": True,
-            "show_performance_metrics": False
+            "show_performance_metrics": False,
+            "headless": False  # No window, no overlays, no keyboard input
         },
         "colors": {
             "volume_bar_low": "green",
@@ -123,6 +161,9 @@ class Config:
             "gesture_prev": "purple",
             "gesture_brightness": "blue"
         },
+        "audio": {
+            "backend": None  # Detected volume backend, cached to skip startup probes
+        },
         "controls": {
             "enable_keyboard_fallback": True,
             "keyboard_shortcuts": {
@@ -138,6 +179,21 @@ class Config:
 
     def __init__(self):
         self.config = self.load_config()
+        # Debounced background save, set() only marks the config dirty
+        self._save_lock = threading.RLock()
+        self._save_timer = None
+        self._dirty = False
+        # Flat mirror of self.config keyed by dot-notation path, for O(1) get()
+        self._flat: Dict[str, Any] = {}
+        self._flatten(self.config)
+
+    def _flatten(self, tree: Dict, prefix: str = '') -> None:
+        """Mirror a nested config tree into the flat lookup table"""
+        for key, value in tree.items():
+            path = prefix + key
+            self._flat[path] = value
+            if isinstance(value, dict):
+                self._flatten(value, path + '.')
 
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file or use defaults"""
@@ -146,23 +202,50 @@ class Config:
                 with open(self.CONFIG_FILE, 'r') as f:
                     loaded_config = json.load(f)
                     # Merge with defaults to handle missing keys
-                    return self._merge_configs(self.DEFAULT_CONFIG, loaded_config)
+                    return self._merge_configs(copy.deepcopy(self.DEFAULT_CONFIG), loaded_config)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load config file: {e}")
                 print("Using default configuration")
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(self.DEFAULT_CONFIG)
         else:
-            return self.DEFAULT_CONFIG.copy()
+            # Deep copy so set() never mutates the nested class-level defaults
+            return copy.deepcopy(self.DEFAULT_CONFIG)
 
     def save_config(self) -> bool:
         """Save current configuration to file"""
-        try:
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
+            # Serialize and write under the lock: a timer flush and an explicit save
+            # cannot interleave, and the newest snapshot is always the one written last.
+            # The temp file + os.replace keeps the config file whole if writing fails
+            data = json.dumps(self.config, indent=4)
+            tmp_path = self.CONFIG_FILE + '.tmp'
+            try:
+                with open(tmp_path, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.CONFIG_FILE)
+                return True
+            except OSError as e:
+                print(f"Error saving config: {e}")
+                return False
+
+    def flush(self) -> bool:
+        """Write pending set() changes to disk, if any"""
+        if not self._dirty:
             return True
-        except IOError as e:
-            print(f"Error saving config: {e}")
-            return False
+        return self.save_config()
+
+    def _schedule_save(self) -> None:
+        """Mark the config dirty and start the debounce timer if it is not running"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
 
     def _merge_configs(self, default: Dict, loaded: Dict) -> Dict:
         """Recursively merge loaded config with defaults"""
@@ -176,26 +259,35 @@ class Config:
 
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation (e.g., 'camera.width')"""
-        keys = key_path.split('.')
-        value = self.config
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key_path, default)
 
     def set(self, key_path: str, value: Any) -> bool:
-        """Set configuration value using dot notation"""
+        """
+        Set configuration value using dot notation
+        The change is written to disk shortly after by a background timer
+        """
         keys = key_path.split('.')
         config = self.config
         try:
-            for key in keys[:-1]:
-                if key not in config:
-                    config[key] = {}
-                config = config[key]
-            config[keys[-1]] = value
-            return self.save_config()
+            with self._save_lock:
+                for i, key in enumerate(keys[:-1]):
+                    if key not in config:
+                        config[key] = {}
+                        self._flat['.'.join(keys[:i + 1])] = config[key]
+                    config = config[key]
+
+                # Drop flat entries of a replaced subtree before mirroring the new value
+                if isinstance(config.get(keys[-1]), dict):
+                    prefix = key_path + '.'
+                    for path in [p for p in self._flat if p.startswith(prefix)]:
+                        del self._flat[path]
+
+                config[keys[-1]] = value
+                self._flat[key_path] = value
+                if isinstance(value, dict):
+                    self._flatten(value, key_path + '.')
+                self._schedule_save()
+            return True
         except Exception as e:
             print(f"Error setting config {key_path}: {e}")
             return False
@@ -213,21 +305,11 @@ class Config:
 
     def get_color(self, color_name: str) -> Tuple[int, int, int]:
         """Get color by name from config"""
-        color_map = {
-            "green": Colors.GREEN,
-            "red": Colors.RED,
-            "blue": Colors.BLUE,
-            "yellow": Colors.YELLOW,
-            "cyan": Colors.CYAN,
-            "orange": Colors.ORANGE,
-            "purple": Colors.PURPLE,
-            "pink": Colors.PINK,
-            "white": Colors.WHITE,
-            "gray": Colors.GRAY,
-            "black": Colors.BLACK
-        }
-        color_key = self.get(f'colors.{color_name}', 'white')
-        return color_map.get(color_key, Colors.WHITE)
+        color_key = self._flat.get(f'colors.{color_name}', 'white')
+        return self.COLOR_MAP.get(color_key, Colors.WHITE)
 
 # Global config instance
 config_instance = Config()
+
+# The debounce timer is a daemon thread and dies with the interpreter - write pending changes on exit
+atexit.register(config_instance.flush)
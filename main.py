@@ -6,6 +6,7 @@ Enhanced version with modular architecture
 
 import sys
 import os
+import logging
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -14,6 +15,12 @@ def main():
     """
     Main entry point for the application
     """
+    # --debug shows gesture trigger messages; errors are always shown
+    logging.basicConfig(
+        level=logging.DEBUG if "--debug" in sys.argv[1:] else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s"
+    )
+
     try:
         from app import main as app_main
         app_main()
@@ -1,7 +1,10 @@
 import platform
 import os
+import importlib.util
+import shutil
 import subprocess
 import time
+from config import config, Performance
 
 class VolumeController:
     """
@@ -16,6 +19,23 @@ class VolumeController:
         self.current_volume = 50
         self.volume_available = False
         self.volume_interface = None
+        self._mixer = None  # alsaaudio mixer (Linux)
+        self._pulse = None  # pulsectl client (Linux)
+        self._pulse_sink = None
+        
+        # Argv prefixes, dipanggil tanpa shell=True (satu fork+exec, tanpa /bin/sh)
+        self._amixer_argv = ['amixer', '-q', 'set', 'Master']
+        self._pactl_argv = ['pactl', 'set-sink-volume', '@DEFAULT_SINK@']
+        self._nircmd_argv = ['nircmd', 'setsysvolume']
+        self._osa = None    # Persistent osascript process (macOS)
+        self._amixer = None  # Persistent 'amixer -s' process (Linux)
+        
+        # Rate limit: burst perubahan volume digabung, ditulis lewat flush()
+        self._last_set = -1
+        self._last_set_time = 0.0
+        self._pending = None
+        self._min_interval = config.get('performance.volume_update_interval',
+                                        Performance.VOLUME_UPDATE_INTERVAL)
         
         print(f"Detected OS: {self.system}")
         
@@ -37,6 +57,13 @@ class VolumeController:
     
     def _init_windows(self):
         """Initialize volume control for Windows"""
+        # find_spec only checks the import path - skip the pycaw/comtypes import when absent
+        if importlib.util.find_spec('pycaw') is None:
+            print("pycaw not available")
+            print("Try: pip install pycaw")
+            self._init_windows_fallback()
+            return
+        
         try:
             from ctypes import cast, POINTER
             from comtypes import CLSCTX_ALL
@@ -48,7 +75,11 @@ class VolumeController:
             self.volume_range = self.volume_interface.GetVolumeRange()
             self.min_volume = self.volume_range[0]
             self.max_volume = self.volume_range[1]
+            # dB level per integer percent, the range is fixed for the device
+            self._db_lut = [self.min_volume + (p / 100.0) * (self.max_volume - self.min_volume)
+                            for p in range(101)]
             self.volume_available = True
+            self._cache_backend('pycaw')
             print("Windows volume control initialized successfully with pycaw")
             
         except ImportError as e:
@@ -60,14 +91,26 @@ class VolumeController:
             print(f"Error initializing Windows volume control: {e}")
             self._init_windows_fallback()
     
+    def _cached_backend(self, *candidates):
+        """Return the backend cached in config if it is one of candidates and still on PATH"""
+        backend = config.get('audio.backend')
+        if backend in candidates and shutil.which(backend):
+            return backend
+        return None
+    
+    def _cache_backend(self, backend):
+        """Remember the detected backend so the next launch skips probing"""
+        if config.get('audio.backend') != backend:
+            config.set('audio.backend', backend)
+    
     def _init_windows_fallback(self):
         """Fallback for Windows without pycaw"""
         try:
-            # Try using nircmd if available
-            result = subprocess.run(['where', 'nircmd'], capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
+            # Try using nircmd if available - filesystem lookup, no subprocess
+            if shutil.which('nircmd'):
                 self.volume_available = True
                 self.windows_fallback = 'nircmd'
+                self._cache_backend('nircmd')
                 print("Using nircmd for volume control")
             else:
                 self.volume_available = False
@@ -79,12 +122,17 @@ class VolumeController:
     def _init_macos(self):
         """Initialize volume control for macOS"""
         try:
-            # Test if osascript works
-            test_cmd = "osascript -e 'get volume settings'"
-            result = subprocess.run(test_cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
+            # Test if osascript works, unless it already did on a previous run
+            if self._cached_backend('osascript'):
+                returncode = 0
+            else:
+                returncode = subprocess.run(['osascript', '-e', 'get volume settings'],
+                                            capture_output=True).returncode
+            if returncode == 0:
                 self.volume_available = True
+                self._cache_backend('osascript')
                 print("macOS volume control initialized successfully")
+                self._osa = self._start_helper(['osascript', '-i'])
             else:
                 self.volume_available = False
                 print("macOS volume control not available")
@@ -92,25 +140,109 @@ class VolumeController:
             print(f"Error initializing macOS volume control: {e}")
             self.volume_available = False
     
+    def _start_helper(self, args):
+        """Start a long-lived process that reads commands from stdin"""
+        try:
+            return subprocess.Popen(
+                args, stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                text=True, bufsize=1
+            )
+        except Exception as e:
+            print(f"Could not start persistent {args[0]}: {e}")
+            return None
+    
+    def _write_helper(self, proc, line):
+        """Send one command line to a persistent helper, False if it is gone"""
+        if proc is None or proc.poll() is not None:
+            return False
+        try:
+            proc.stdin.write(line + "\n")
+            proc.stdin.flush()
+            return True
+        except (BrokenPipeError, OSError) as e:
+            print(f"Persistent {proc.args[0]} failed, falling back: {e}")
+            return False
+    
+    def _stop_helper(self, proc):
+        """Close stdin of a persistent helper and wait for it to exit"""
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=1.0)
+        except Exception:
+            proc.kill()
+    
+    def _init_linux_pulsectl(self):
+        """Initialize in-process PulseAudio client via pulsectl (libpulse)"""
+        try:
+            import pulsectl
+        except ImportError:
+            return False
+        
+        try:
+            self._pulse = pulsectl.Pulse('gesture-media-control')
+            self._pulse_sink = self._default_pulse_sink()
+            return True
+        except Exception as e:
+            print(f"pulsectl not available: {e}")
+            if self._pulse is not None:
+                self._pulse.close()
+            self._pulse = None
+            return False
+    
+    def _default_pulse_sink(self):
+        """Look up the current default sink (it can change while running)"""
+        return self._pulse.get_sink_by_name(self._pulse.server_info().default_sink_name)
+    
+    def _init_linux_alsaaudio(self):
+        """Initialize in-process ALSA mixer via pyalsaaudio"""
+        try:
+            import alsaaudio
+        except ImportError:
+            return False
+        
+        try:
+            # Prefer 'Master', otherwise the first control with a similar name
+            mixers = alsaaudio.mixers()
+            name = 'Master'
+            if name not in mixers and mixers:
+                name = next((m for m in mixers if 'master' in m.lower()), mixers[0])
+            self._mixer = alsaaudio.Mixer(name)
+            return True
+        except Exception as e:
+            print(f"pyalsaaudio mixer not available: {e}")
+            self._mixer = None
+            return False
+    
     def _init_linux(self):
         """Initialize volume control for Linux"""
         try:
-            # Try amixer first
-            test_cmd = "amixer sget Master"
-            result = subprocess.run(test_cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
+            # Prefer in-process libraries - no subprocess per volume change
+            if self._init_linux_pulsectl():
                 self.volume_available = True
-                self.linux_mixer = 'amixer'
-                print("Linux volume control initialized with amixer")
+                self.linux_mixer = 'pulsectl'
+                print("Linux volume control initialized with pulsectl")
                 return
-                
-            # Try pactl as fallback
-            test_cmd = "pactl list sinks"
-            result = subprocess.run(test_cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
+            
+            if self._init_linux_alsaaudio():
+                self.volume_available = True
+                self.linux_mixer = 'alsaaudio'
+                print("Linux volume control initialized with pyalsaaudio")
+                return
+            
+            # Backend detected on a previous run, otherwise probe amixer then pactl
+            mixer = self._cached_backend('amixer', 'pactl') or self._probe_linux_mixers()
+            
+            if mixer is not None:
                 self.volume_available = True
-                self.linux_mixer = 'pactl'
-                print("Linux volume control initialized with pactl")
+                self.linux_mixer = mixer
+                self._cache_backend(mixer)
+                if mixer == 'amixer':
+                    # 'amixer -s' reads commands from stdin - one process for all updates
+                    self._amixer = self._start_helper(['amixer', '-q', '-s'])
+                print(f"Linux volume control initialized with {mixer}")
             else:
                 self.volume_available = False
                 print("Linux volume control not available")
@@ -119,40 +251,98 @@ class VolumeController:
             print(f"Error initializing Linux volume control: {e}")
             self.volume_available = False
     
+    def _probe_linux_mixers(self):
+        """
+        Probe amixer and pactl in a single shell invocation
+        Returns the first working mixer in preference order, or None
+        """
+        probes = [(name, cmd) for name, cmd in (('amixer', 'amixer sget Master'),
+                                                ('pactl', 'pactl list sinks'))
+                  if shutil.which(name)]
+        if not probes:
+            return None
+        
+        script = '; '.join(f"{cmd} >/dev/null 2>&1 && echo {name}" for name, cmd in probes)
+        result = subprocess.run(['sh', '-c', script], capture_output=True, text=True)
+        working = result.stdout.split()
+        return working[0] if working else None
+    
     def set_volume(self, volume_percent):
         """
         Mengatur volume sistem dengan multiple fallback methods
         """
-        volume_percent = max(0, min(100, volume_percent))
+        volume_percent = int(round(max(0, min(100, volume_percent))))
+        
+        # Nilai yang sama dengan yang terakhir ditulis tidak perlu system call
+        if volume_percent == self._last_set:
+            self._pending = None
+            self.current_volume = volume_percent
+            return True
+        
+        # Terlalu cepat sejak penulisan terakhir: simpan, ditulis oleh flush()
+        now = time.monotonic()
+        if now - self._last_set_time < self._min_interval:
+            self._pending = volume_percent
+            self.current_volume = volume_percent
+            return True
+        
+        return self._write_volume(volume_percent, now)
+    
+    def flush(self):
+        """
+        Tulis perubahan volume yang tertunda jika interval update sudah lewat
+        """
+        if self._pending is None:
+            return True
+        now = time.monotonic()
+        if now - self._last_set_time < self._min_interval:
+            return True
+        return self._write_volume(self._pending, now)
+    
+    def _write_volume(self, volume_percent, now):
+        """
+        Terapkan volume ke backend sistem
+        """
+        self._pending = None
+        self._last_set_time = now
+        
         old_volume = self.current_volume
         self.current_volume = volume_percent
         
         if not self.volume_available:
             print(f"[SIMULATION] Volume set to: {volume_percent}%")
+            self._last_set = volume_percent
             return True
             
         try:
             if self.system == "Windows":
-                return self._set_volume_windows(volume_percent)
+                ok = self._set_volume_windows(volume_percent)
             elif self.system == "Darwin":
-                return self._set_volume_macos(volume_percent)
+                ok = self._set_volume_macos(volume_percent)
             elif self.system == "Linux":
-                return self._set_volume_linux(volume_percent)
+                ok = self._set_volume_linux(volume_percent)
             else:
-                return False
+                ok = False
                 
         except Exception as e:
             print(f"Error setting volume: {e}")
-            self.current_volume = old_volume  # Rollback on error
-            return False
+            ok = False
+        
+        if ok:
+            # Hanya nilai yang benar-benar diterapkan backend yang boleh di-skip nanti
+            self._last_set = volume_percent
+            return True
+        
+        # Gagal: rollback, dan nilai yang sama akan dicoba lagi pada set_volume berikutnya
+        self._last_set = -1
+        self.current_volume = old_volume
+        return False
     
     def _set_volume_windows(self, volume_percent):
         """Set volume for Windows"""
         if self.volume_interface:
             try:
-                volume_scalar = volume_percent / 100.0
-                volume_db = self.min_volume + (volume_scalar * (self.max_volume - self.min_volume))
-                self.volume_interface.SetMasterVolumeLevel(volume_db, None)
+                self.volume_interface.SetMasterVolumeLevel(self._db_lut[int(volume_percent)], None)
                 return True
             except Exception as e:
                 print(f"Error with pycaw: {e}")
@@ -164,8 +354,8 @@ class VolumeController:
         """Fallback volume control for Windows"""
         try:
             if hasattr(self, 'windows_fallback') and self.windows_fallback == 'nircmd':
-                cmd = f'nircmd setsysvolume {int(volume_percent * 655.35)}'
-                subprocess.run(cmd, shell=True, capture_output=True)
+                subprocess.run(self._nircmd_argv + [str(int(volume_percent * 655.35))],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 return True
         except Exception as e:
             print(f"Error with Windows fallback: {e}")
@@ -173,9 +363,14 @@ class VolumeController:
     
     def _set_volume_macos(self, volume_percent):
         """Set volume for macOS"""
+        if self._osa is not None:
+            if self._write_helper(self._osa, f"set volume output volume {int(volume_percent)}"):
+                return True
+            self._osa = None
+        
         try:
-            cmd = f"osascript -e 'set volume output volume {volume_percent}'"
-            subprocess.run(cmd, shell=True, capture_output=True)
+            subprocess.run(['osascript', '-e', f'set volume output volume {int(volume_percent)}'],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
         except Exception as e:
             print(f"Error setting macOS volume: {e}")
@@ -185,12 +380,26 @@ class VolumeController:
         """Set volume for Linux"""
         try:
             if hasattr(self, 'linux_mixer'):
-                if self.linux_mixer == 'amixer':
-                    cmd = f"amixer set Master {volume_percent}% > /dev/null 2>&1"
+                if self.linux_mixer == 'pulsectl':
+                    try:
+                        self._pulse.volume_set_all_chans(self._pulse_sink, volume_percent / 100.0)
+                    except Exception:
+                        # Default sink changed or went away - resolve it again once
+                        self._pulse_sink = self._default_pulse_sink()
+                        self._pulse.volume_set_all_chans(self._pulse_sink, volume_percent / 100.0)
+                    return True
+                elif self.linux_mixer == 'alsaaudio':
+                    self._mixer.setvolume(int(volume_percent))
+                    return True
+                elif self.linux_mixer == 'amixer':
+                    if self._write_helper(self._amixer, f"sset Master {int(volume_percent)}%"):
+                        return True
+                    self._amixer = None
+                    argv = self._amixer_argv + [f"{int(volume_percent)}%"]
                 elif self.linux_mixer == 'pactl':
-                    cmd = f"pactl set-sink-volume @DEFAULT_SINK@ {volume_percent}%"
+                    argv = self._pactl_argv + [f"{int(volume_percent)}%"]
                 
-                subprocess.run(cmd, shell=True, capture_output=True)
+                subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 return True
         except Exception as e:
             print(f"Error setting Linux volume: {e}")
@@ -239,13 +448,13 @@ class VolumeController:
         """Toggle mute for macOS"""
         try:
             # Get current mute state
-            get_cmd = "osascript -e 'output muted of (get volume settings)'"
-            result = subprocess.run(get_cmd, shell=True, capture_output=True, text=True)
+            result = subprocess.run(['osascript', '-e', 'output muted of (get volume settings)'],
+                                    capture_output=True, text=True)
             if result.returncode == 0:
                 current_mute = 'true' in result.stdout.lower()
                 new_mute = 'false' if current_mute else 'true'
-                set_cmd = f"osascript -e 'set volume output muted {new_mute}'"
-                subprocess.run(set_cmd, shell=True, capture_output=True)
+                subprocess.run(['osascript', '-e', f'set volume output muted {new_mute}'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 print(f"macOS mute toggled: {'ON' if new_mute == 'true' else 'OFF'}")
                 return True
         except Exception as e:
@@ -256,23 +465,57 @@ class VolumeController:
         """Toggle mute for Linux"""
         try:
             if hasattr(self, 'linux_mixer'):
-                if self.linux_mixer == 'amixer':
+                if self.linux_mixer == 'pulsectl':
+                    # Refresh the sink so the mute state is current
+                    self._pulse_sink = self._default_pulse_sink()
+                    self._pulse.mute(self._pulse_sink, not self._pulse_sink.mute)
+                    print(f"Linux mute toggled")
+                    return True
+                elif self.linux_mixer == 'alsaaudio':
+                    muted = any(self._mixer.getmute())
+                    self._mixer.setmute(0 if muted else 1)
+                    print(f"Linux mute toggled")
+                    return True
+                elif self.linux_mixer == 'amixer':
                     # Toggle mute with amixer
-                    cmd = "amixer set Master toggle > /dev/null 2>&1"
+                    if self._write_helper(self._amixer, "sset Master toggle"):
+                        print(f"Linux mute toggled")
+                        return True
+                    argv = self._amixer_argv + ['toggle']
                 elif self.linux_mixer == 'pactl':
                     # For pactl, we need to get current state and toggle
-                    get_cmd = "pactl get-sink-mute @DEFAULT_SINK@"
-                    result = subprocess.run(get_cmd, shell=True, capture_output=True, text=True)
+                    result = subprocess.run(['pactl', 'get-sink-mute', '@DEFAULT_SINK@'],
+                                            capture_output=True, text=True)
                     if result.returncode == 0:
                         current_mute = 'yes' in result.stdout.lower()
                         new_mute = 'no' if current_mute else 'yes'
-                        cmd = f"pactl set-sink-mute @DEFAULT_SINK@ {new_mute}"
+                        argv = ['pactl', 'set-sink-mute', '@DEFAULT_SINK@', new_mute]
                     else:
                         return False
 
-                subprocess.run(cmd, shell=True, capture_output=True)
+                subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 print(f"Linux mute toggled")
                 return True
         except Exception as e:
             print(f"Error toggling Linux mute: {e}")
         return False
+
+    def close(self):
+        """
+        Release persistent audio handles
+        """
+        if self._pending is not None:
+            self._write_volume(self._pending, time.monotonic())
+
+        self._stop_helper(self._osa)
+        self._osa = None
+        self._stop_helper(self._amixer)
+        self._amixer = None
+
+        if self._mixer is not None:
+            self._mixer.close()
+            self._mixer = None
+
+        if self._pulse is not None:
+            self._pulse.close()
+            self._pulse = None
@@ -0,0 +1,99 @@
+"""
+Background camera capture for Gesture Media Control
+Overlaps frame grabbing with hand detection on the main thread
+"""
+
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+class CameraThread:
+    """
+    Reads frames from a cv2.VideoCapture on a background thread,
+    keeping only the newest frame in a single slot
+    """
+
+    def __init__(self, capture, read_timeout: float = 1.0, lazy_decode: bool = False):
+        """
+        lazy_decode=True grabs every frame but only decodes (retrieve) the first
+        grab after read() asks for one, so frames nobody reads are never decoded.
+        Saves CPU on MJPEG/H264 cameras when the consumer is slower than the
+        camera, at the cost of up to one camera frame period of latency per read
+        """
+        self.capture = capture
+        self.read_timeout = read_timeout
+        self.lazy_decode = lazy_decode
+        self.running = False
+        self._thread = None
+
+        # Single-slot buffer: the capture thread overwrites, read() takes ownership
+        self._lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._want = threading.Event()  # lazy_decode: read() is waiting for a frame
+        self._latest = None
+        self._ok = True
+
+    def start(self) -> "CameraThread":
+        """Start the capture thread"""
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        """Capture loop - grab frames as fast as the camera delivers them"""
+        while self.running:
+            if self.lazy_decode:
+                ok = self.capture.grab()
+                if ok and not self._want.is_set():
+                    continue  # Nobody is waiting - skip the decode
+                self._want.clear()
+                frame = self.capture.retrieve()[1] if ok else None
+                ok = ok and frame is not None
+            else:
+                ok, frame = self.capture.read()
+            with self._lock:
+                self._ok = ok
+                if ok:
+                    self._latest = frame
+            self._new_frame.set()
+            if not ok:
+                print("Camera thread stopped: failed to read frame")
+                break
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Return the newest frame, same contract as cv2.VideoCapture.read()
+        Waits for a new frame instead of busy-polling or returning a duplicate
+        """
+        if self.lazy_decode:
+            # Drop a frame published after an earlier read timed out, then ask
+            # the capture thread to decode its next grab
+            with self._lock:
+                if self._ok:
+                    self._new_frame.clear()
+                    self._latest = None
+            self._want.set()
+
+        if not self._new_frame.wait(self.read_timeout):
+            return False, None
+
+        with self._lock:
+            self._new_frame.clear()
+            # VideoCapture.read allocates a fresh array per frame, so hand it
+            # over without copying and drop our reference
+            frame, self._latest = self._latest, None
+            return self._ok and frame is not None, frame
+
+    def isOpened(self) -> bool:
+        """Mirror cv2.VideoCapture.isOpened()"""
+        return self.running and self.capture.isOpened()
+
+    def release(self) -> None:
+        """Stop the capture thread and release the camera"""
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout=self.read_timeout)
+            self._thread = None
+        self.capture.release()
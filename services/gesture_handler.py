@@ -5,10 +5,15 @@ Handles gesture detection, action mapping, and control logic
 
 import time
 import math
+import logging
+import queue
+import threading
 from typing import Optional, Dict, Any, Callable, List
 from config import config, Gestures
 from HandTrackingModule import HandDetector
-import numpy as np
+from _gesture_jit import GESTURE_NAMES, OK, PEACE, MUTE, UNMUTE, PREVIOUS, BRIGHTNESS
+
+logger = logging.getLogger(__name__)
 
 class GestureAction:
     """
@@ -21,22 +26,54 @@ class GestureAction:
         self.cooldown = cooldown
         self.last_triggered = 0
 
-    def can_trigger(self) -> bool:
+    def can_trigger(self, now: Optional[float] = None) -> bool:
         """Check if action can be triggered (cooldown check)"""
-        return time.time() - self.last_triggered >= self.cooldown
+        if now is None:
+            now = time.time()
+        return now - self.last_triggered >= self.cooldown
 
-    def trigger(self, *args, **kwargs) -> bool:
-        """Trigger the action if cooldown allows"""
-        if self.can_trigger():
-            self.last_triggered = time.time()
+    def trigger(self, *args, now: Optional[float] = None, **kwargs) -> bool:
+        """
+        Trigger the action if cooldown allows
+        now is the caller's time.time() for this frame, read here if omitted
+        """
+        if now is None:
+            now = time.time()
+        if self.can_trigger(now):
+            self.last_triggered = now
             try:
                 self.callback(*args, **kwargs)
                 return True
             except Exception as e:
-                print(f"Error executing gesture action {self.name}: {e}")
+                logger.error("Error executing gesture action %s: %s", self.name, e)
                 return False
         return False
 
+class GestureInfo:
+    """
+    Per-frame gesture result, one instance reused across frames
+    """
+
+    __slots__ = ('gesture', 'action_taken', 'gesture_duration', 'discrete_action',
+                 'volume_distance', 'raw_volume', 'smooth_volume', 'volume_set',
+                 'brightness_distance', 'brightness')
+
+    def __init__(self):
+        self.reset("No Hand")
+
+    def reset(self, gesture: str) -> None:
+        """Clear all fields for a new frame"""
+        self.gesture = gesture
+        self.action_taken = False
+        self.gesture_duration = 0.0
+        self.discrete_action = None
+        self.volume_distance = None
+        self.raw_volume = None
+        self.smooth_volume = None
+        self.volume_set = None
+        self.brightness_distance = None
+        self.brightness = None
+
 class GestureHandler:
     """
     Handles gesture detection and action mapping
@@ -50,170 +87,223 @@ class GestureHandler:
         self.last_gesture = "No Hand"
         self.gesture_start_time = 0
         self.volume_smoothing_factor = config.get('performance.smoothing_factor')
+        # Single EMA on the mapped volume, replacing the distance EMA (0.3) followed
+        # by the volume EMA; their time constants add, so the settling speed matches
+        lag = (1 - 0.3) / 0.3 + (1 - self.volume_smoothing_factor) / self.volume_smoothing_factor
+        self._volume_alpha = 1.0 / (1.0 + lag)
         self.smooth_volume = volume_controller.get_volume()
+        self.max_landmark_age_ms = config.get('gestures.max_landmark_age_ms',
+                                              Gestures.MAX_LANDMARK_AGE_MS)
 
-        # Gesture action mappings
+        # Gesture action mappings, keyed by the detector's own gesture name objects
+        # so the per-frame lookup matches by identity without comparing strings
         self.actions = {
-            "OK": GestureAction("Play/Pause", self._action_play_pause),
-            "Peace": GestureAction("Next Track", self._action_next_track),
-            "Mute": GestureAction("Mute Toggle", self._action_mute_toggle),
-            "Unmute": GestureAction("Unmute Toggle", self._action_unmute_toggle),
-            "Previous": GestureAction("Previous Track", self._action_prev_track),
-            "Brightness": GestureAction("Brightness Control", self._action_brightness_control)
+            GESTURE_NAMES[OK]: GestureAction("Play/Pause", self._action_play_pause),
+            GESTURE_NAMES[PEACE]: GestureAction("Next Track", self._action_next_track),
+            GESTURE_NAMES[MUTE]: GestureAction("Mute Toggle", self._action_mute_toggle),
+            GESTURE_NAMES[UNMUTE]: GestureAction("Unmute Toggle", self._action_unmute_toggle),
+            GESTURE_NAMES[PREVIOUS]: GestureAction("Previous Track", self._action_prev_track),
+            GESTURE_NAMES[BRIGHTNESS]: GestureAction("Brightness Control", self._action_brightness_control)
         }
 
         # Gesture state tracking
         self.volume_control_active = False
         self.brightness_control_active = False
         self.last_volume_distance = 0
+        self.last_brightness_distance = 0
+        # Last integer values sent to the controllers; unchanged values are not resent
+        self._last_volume_set = -1
+        self._last_brightness_set = -1
 
-        print("GestureHandler initialized")
+        # Linear distance -> 0-100 mapping, precomputed once
+        min_dist, max_dist = config.volume_distance_range
+        self._dist_min = min_dist
+        self._dist_scale = 100.0 / (max_dist - min_dist)
+
+        # Result carrier returned by detect_and_handle_gesture, reused every frame
+        self._info = GestureInfo()
+
+        # Brightness writes (WMI/ddcutil, 50-200 ms) run on a worker so they never
+        # stall the capture loop; the single-slot queue keeps only the newest value
+        self._brightness_q = None
+        self._brightness_worker = None
+        if brightness_controller:
+            self._brightness_q = queue.Queue(maxsize=1)
+            self._brightness_worker = threading.Thread(target=self._brightness_loop, daemon=True)
+            self._brightness_worker.start()
+
+        logger.info("GestureHandler initialized")
 
     def set_detector(self, detector: HandDetector) -> None:
         """Set the hand detector instance"""
         self.detector = detector
 
-    def detect_and_handle_gesture(self, img) -> Dict[str, Any]:
+    def detect_and_handle_gesture(self, img) -> GestureInfo:
         """
         Main gesture detection and handling method
         Returns gesture info and any actions taken
+        The returned GestureInfo is reused and overwritten on the next call
         """
+        info = self._info
         if not self.detector or not self.detector.available:
-            return {"gesture": "No Hand", "action_taken": False, "details": {}}
+            info.reset("No Hand")
+            return info
+
+        # One clock read per frame, shared by cooldowns and gesture duration
+        now = time.time()
 
         # Get current gesture
         gesture = self.detector.detect_gesture()
         self.current_gesture = gesture
-
-        action_taken = False
-        details = {}
+        info.reset(gesture)
 
         # Handle continuous gestures (volume/brightness control)
         if gesture == "Volume Control":
-            action_taken, vol_details = self._handle_volume_control(img)
-            details.update(vol_details)
+            info.action_taken = self._handle_volume_control(img, info)
         elif gesture == "Brightness" and self.brightness_controller:
-            action_taken, bright_details = self._handle_brightness_control(img)
-            details.update(bright_details)
+            info.action_taken = self._handle_brightness_control(img, info)
         else:
             # Reset continuous gesture states
             self.volume_control_active = False
             self.brightness_control_active = False
 
         # Handle discrete gestures (play/pause, etc.)
-        if gesture in self.actions and gesture != self.last_gesture:
-            if self.actions[gesture].trigger():
-                action_taken = True
-                details["discrete_action"] = gesture
+        action = self.actions.get(gesture)
+        if action is not None and gesture != self.last_gesture and action.trigger(now=now):
+            info.action_taken = True
+            info.discrete_action = gesture
 
         # Track gesture changes
         if gesture != self.last_gesture:
-            self.gesture_start_time = time.time()
+            self.gesture_start_time = now
             self.last_gesture = gesture
 
-        return {
-            "gesture": gesture,
-            "action_taken": action_taken,
-            "details": details,
-            "gesture_duration": time.time() - self.gesture_start_time
-        }
+        info.gesture_duration = now - self.gesture_start_time
+        return info
 
-    def _handle_volume_control(self, img) -> tuple[bool, Dict[str, Any]]:
-        """Handle volume control gesture"""
+    def _handle_volume_control(self, img, info: GestureInfo) -> bool:
+        """Handle volume control gesture, filling the volume fields of info"""
         if not self.detector.landmarks_list:
-            return False, {}
+            return False
+
+        # Ignore stale landmarks when inference lags, otherwise volume overshoots
+        if self.detector.latest_result_age_ms > self.max_landmark_age_ms:
+            return False
 
         # Calculate distance between thumb and index finger
-        length, img, info = self.detector.find_distance(4, 8, img, draw=False)
+        length = math.sqrt(self.detector.distance2(4, 8))
 
-        # Apply distance smoothing to reduce jitter
-        if self.last_volume_distance == 0:
-            self.last_volume_distance = length
-        else:
-            self.last_volume_distance = (self.last_volume_distance * 0.7 + length * 0.3)
+        self.last_volume_distance = length  # Reported only, smoothing happens on volume
 
         # Convert distance to volume
-        min_dist, max_dist = config.volume_distance_range
-        volume = np.interp(self.last_volume_distance, [min_dist, max_dist], [0, 100])
-        volume = max(0, min(100, volume))
+        volume = (length - self._dist_min) * self._dist_scale
+        volume = 0.0 if volume < 0 else (100.0 if volume > 100 else volume)
 
-        # Apply smoothing
-        self.smooth_volume = (self.smooth_volume * (1 - self.volume_smoothing_factor) +
-                            volume * self.volume_smoothing_factor)
+        # Apply smoothing - one EMA reduces jitter from both distance and volume
+        self.smooth_volume += self._volume_alpha * (volume - self.smooth_volume)
 
-        # Set volume
-        self.volume_controller.set_volume(int(self.smooth_volume))
+        # Set volume only when the integer value changes
+        volume_set = int(self.smooth_volume)
+        if volume_set != self._last_volume_set:
+            self.volume_controller.set_volume(volume_set)
+            self._last_volume_set = volume_set
         self.volume_control_active = True
 
-        return True, {
-            "volume_distance": self.last_volume_distance,
-            "raw_volume": volume,
-            "smooth_volume": self.smooth_volume,
-            "volume_set": int(self.smooth_volume)
-        }
+        info.volume_distance = self.last_volume_distance
+        info.raw_volume = volume
+        info.smooth_volume = self.smooth_volume
+        info.volume_set = volume_set
+        return True
 
-    def _handle_brightness_control(self, img) -> tuple[bool, Dict[str, Any]]:
-        """Handle brightness control gesture"""
+    def _handle_brightness_control(self, img, info: GestureInfo) -> bool:
+        """Handle brightness control gesture, filling the brightness fields of info"""
         if not self.brightness_controller or not self.detector.landmarks_list:
-            return False, {}
+            return False
 
         # For brightness, we can use the same distance calculation
         # but map it to brightness levels instead
-        length, img, info = self.detector.find_distance(4, 8, img, draw=False)
+        length = math.sqrt(self.detector.distance2(4, 8))
 
         # Smooth the distance
-        if not hasattr(self, 'last_brightness_distance'):
+        if self.last_brightness_distance == 0:
             self.last_brightness_distance = length
         else:
-            self.last_brightness_distance = (self.last_brightness_distance * 0.7 + length * 0.3)
+            self.last_brightness_distance += 0.3 * (length - self.last_brightness_distance)
 
-        # Convert to brightness (0-100)
-        min_dist, max_dist = config.volume_distance_range  # Reuse same range
-        brightness = np.interp(self.last_brightness_distance, [min_dist, max_dist], [0, 100])
-        brightness = max(0, min(100, brightness))
+        # Convert to brightness (0-100), reusing the volume distance range
+        brightness = (self.last_brightness_distance - self._dist_min) * self._dist_scale
+        brightness = 0.0 if brightness < 0 else (100.0 if brightness > 100 else brightness)
 
-        # Set brightness
-        self.brightness_controller.set_brightness(int(brightness))
+        # Set brightness only when the integer value changes
+        brightness_set = int(brightness)
+        if brightness_set != self._last_brightness_set:
+            self._post_brightness(brightness_set)
+            self._last_brightness_set = brightness_set
         self.brightness_control_active = True
 
-        return True, {
-            "brightness_distance": self.last_brightness_distance,
-            "brightness": brightness
-        }
+        info.brightness_distance = self.last_brightness_distance
+        info.brightness = brightness
+        return True
+
+    def _post_brightness(self, value: Optional[int]) -> None:
+        """Hand the newest brightness value to the worker, dropping an unapplied one"""
+        try:
+            self._brightness_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._brightness_q.put_nowait(value)
+
+    def _brightness_loop(self) -> None:
+        """Apply brightness values off the capture loop; None stops the worker"""
+        while True:
+            value = self._brightness_q.get()
+            if value is None:
+                break
+            try:
+                self.brightness_controller.set_brightness(value)
+            except Exception as e:
+                logger.error("Error setting brightness: %s", e)
+
+    def close(self) -> None:
+        """Stop the brightness worker"""
+        if self._brightness_worker is not None:
+            self._post_brightness(None)
+            self._brightness_worker.join(timeout=1.0)
+            self._brightness_worker = None
 
     def _action_play_pause(self) -> None:
         """Play/Pause media action"""
-        print("Play/Pause triggered")
+        logger.debug("Play/Pause triggered")
         # This would integrate with media control library
         # For now, just print - can be extended to control media players
 
     def _action_next_track(self) -> None:
         """Next track action"""
-        print("Next track triggered")
+        logger.debug("Next track triggered")
         # Media control integration
 
     def _action_prev_track(self) -> None:
         """Previous track action"""
-        print("Previous track triggered")
+        logger.debug("Previous track triggered")
         # Media control integration
 
     def _action_mute_toggle(self) -> None:
         """Mute toggle action"""
-        print("Mute toggle triggered")
+        logger.debug("Mute toggle triggered")
         # Toggle mute using volume controller
         try:
             self.volume_controller.toggle_mute()
         except Exception as e:
-            print(f"Error toggling mute: {e}")
+            logger.error("Error toggling mute: %s", e)
 
     def _action_unmute_toggle(self) -> None:
         """Unmute toggle action"""
-        print("Unmute toggle triggered")
+        logger.debug("Unmute toggle triggered")
         # Toggle mute using volume controller (same as mute toggle)
         try:
             self.volume_controller.toggle_mute()
         except Exception as e:
-            print(f"Error toggling unmute: {e}")
+            logger.error("Error toggling unmute: %s", e)
 
     def _action_brightness_control(self) -> None:
         """Brightness control action (continuous)"""
@@ -238,132 +328,8 @@ class GestureHandler:
         self.volume_control_active = False
         self.brightness_control_active = False
         self.smooth_volume = self.volume_controller.get_volume()
-
-# Enhanced gesture detection methods for HandDetector
-def detect_mute_gesture(self) -> str:
-    """Detect mute gesture (closed fist)"""
-    if not self.landmarks_list or len(self.landmarks_list) < 21:
-        return "Unknown"
-
-    fingers = self.fingers_up()
-    if not fingers:
-        return "Unknown"
-
-    # All fingers down (closed fist)
-    if sum(fingers) == 0:
-        return "Mute"
-    return "Unknown"
-
-def detect_previous_gesture(self) -> str:
-    """Detect previous track gesture (thumb down)"""
-    if not self.landmarks_list or len(self.landmarks_list) < 21:
-        return "Unknown"
-
-    fingers = self.fingers_up()
-    if not fingers:
-        return "Unknown"
-
-    # Only thumb down, others up (or thumb pointing down)
-    thumb_tip = self.landmarks_list[4]
-    thumb_base = self.landmarks_list[2]
-
-    # Check if thumb is pointing down
-    if thumb_tip[2] > thumb_base[2] and sum(fingers[1:]) >= 3:  # Thumb down, others up
-        return "Previous"
-    return "Unknown"
-
-def detect_brightness_gesture(self) -> str:
-    """Detect brightness control gesture (open palm)"""
-    if not self.landmarks_list or len(self.landmarks_list) < 21:
-        return "Unknown"
-
-    fingers = self.fingers_up()
-    if not fingers:
-        return "Unknown"
-
-    # All fingers up (open palm)
-    if sum(fingers) == 5:
-        return "Brightness"
-    return "Unknown"
-
-def detect_unmute_gesture(self) -> str:
-    """Detect unmute gesture (open hand/palm spread)"""
-    if not self.landmarks_list or len(self.landmarks_list) < 21:
-        return "Unknown"
-
-    fingers = self.fingers_up()
-    if not fingers:
-        return "Unknown"
-
-    # All fingers spread out (open hand) - similar to brightness but different context
-    # For unmute, we want a more relaxed open hand gesture
-    if sum(fingers) >= 4:  # At least 4 fingers up (allowing some flexibility)
-        # Check if fingers are spread apart (not close together like OK gesture)
-        # Calculate distances between finger tips to ensure they're spread
-        try:
-            # Check distance between index and middle finger tips
-            dist_im, _, _ = self.find_distance(8, 12, draw=False)
-            # Check distance between middle and ring finger tips
-            dist_mr, _, _ = self.find_distance(12, 16, draw=False)
-
-            # If fingers are spread apart (distance > threshold), it's unmute
-            if dist_im > 50 and dist_mr > 50:  # Adjust threshold as needed
-                return "Unmute"
-        except:
-            # Fallback: if distance calculation fails, just check finger count
-            if sum(fingers) == 5:
-                return "Unmute"
-
-    return "Unknown"
-
-# Monkey patch the HandDetector class to add new gesture methods
-HandDetector.detect_mute_gesture = detect_mute_gesture
-HandDetector.detect_previous_gesture = detect_previous_gesture
-HandDetector.detect_brightness_gesture = detect_brightness_gesture
-HandDetector.detect_unmute_gesture = detect_unmute_gesture
-
-# Enhanced detect_gesture method
-def enhanced_detect_gesture(self) -> str:
-    """Enhanced gesture detection with more gestures"""
-    if not self.landmarks_list:
-        return "No Hand"
-
-    fingers = self.fingers_up()
-    if not fingers:
-        return "Unknown"
-
-    # Volume Control Gesture (thumb and index up, others down)
-    if fingers[1] == 1 and fingers[0] == 1 and sum(fingers[2:]) == 0:
-        return "Volume Control"
-
-    # OK Gesture
-    if fingers[1] == 1 and fingers[0] == 0 and sum(fingers[2:]) == 0:
-        distance, _, _ = self.find_distance(4, 8, draw=False)
-        if distance < config.get('gestures.ok_distance_threshold'):
-            return "OK"
-
-    # Peace Gesture
-    if fingers[1] == 1 and fingers[2] == 1 and sum(fingers[3:]) == 0 and fingers[0] == 0:
-        return "Peace"
-
-    # New gestures
-    mute = self.detect_mute_gesture()
-    if mute != "Unknown":
-        return mute
-
-    prev = self.detect_previous_gesture()
-    if prev != "Unknown":
-        return prev
-
-    bright = self.detect_brightness_gesture()
-    if bright != "Unknown":
-        return bright
-
-    unmute = self.detect_unmute_gesture()
-    if unmute != "Unknown":
-        return unmute
-
-    return "Unknown"
-
-# Replace the original detect_gesture method
-HandDetector.detect_gesture = enhanced_detect_gesture
+        # 0 makes the distance EMAs re-seed from the next sample
+        self.last_volume_distance = 0
+        self.last_brightness_distance = 0
+        self._last_volume_set = -1
+        self._last_brightness_set = -1
@@ -7,27 +7,204 @@ import cv2
 import numpy as np
 import math
 import time
+from collections import deque
+from functools import lru_cache
 from typing import Tuple, Optional, List
 from config import config, Colors, Fonts, UI, VolumeBar
 
+@lru_cache(maxsize=4)
+def _background_gradient(bar_height: int) -> np.ndarray:
+    """Subtle gray background gradient as a (bar_height, 1, 3) column"""
+    ratio = np.arange(bar_height) / bar_height
+    intensity = (255 * (0.2 + 0.1 * ratio)).astype(np.uint8)
+    return np.repeat(intensity[:, None, None], 3, axis=2)
+
+@lru_cache(maxsize=512)
+def _text_sprite(text: str, font_scale: float, color: Tuple[int, int, int],
+                 thickness: int) -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """
+    cv2.putText rendered once into a tight (sprite, mask, dx, dy) tuple,
+    where (dx, dy) is the sprite's top-left offset from the text origin
+    """
+    (text_w, text_h), baseline = cv2.getTextSize(text, Fonts.FONT, font_scale, thickness)
+    pad = thickness + 1
+    sprite = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad, 3), np.uint8)
+    mask = np.zeros(sprite.shape[:2], np.uint8)
+    origin = (pad, pad + text_h)
+    cv2.putText(sprite, text, origin, Fonts.FONT, font_scale, color, thickness)
+    cv2.putText(mask, text, origin, Fonts.FONT, font_scale, 255, thickness)
+    return sprite, mask, -pad, -(pad + text_h)
+
+@lru_cache(maxsize=1024)
+def _fill_gradient(fill_height: int, high: bool) -> np.ndarray:
+    """
+    Volume fill gradient as a (fill_height, 1, 3) BGR column:
+    green to yellow below 50%, yellow to red from 50% up,
+    with the fading white highlight already applied to the top rows
+    """
+    ratio = np.arange(fill_height) / fill_height
+    column = np.zeros((fill_height, 1, 3), np.uint8)
+    if high:
+        column[:, 0, 1] = np.clip(255 * (1 - (ratio - 0.5) * 2), 0, 255).astype(np.uint8)
+        column[:, 0, 2] = 255
+    else:
+        column[:, 0, 1] = 255
+        column[:, 0, 2] = np.clip(255 * (ratio * 2), 0, 255).astype(np.uint8)
+
+    # Highlight effect on top
+    highlight_height = max(3, int(fill_height * VolumeBar.HIGHLIGHT_HEIGHT_RATIO))
+    rows = min(highlight_height, fill_height)
+    alpha = 1.0 - np.arange(rows) / highlight_height
+    column[:rows] = (255 * alpha).astype(np.uint8)[:, None, None]
+    return column
+
 class UIDisplay:
     """
     Handles all UI rendering and visualization
     """
 
+    # Feedback text shown when a discrete gesture fires
+    FEEDBACK_MESSAGES = {
+        "OK": "PLAY/PAUSE",
+        "Peace": "NEXT TRACK",
+        "Mute": "MUTE TOGGLE",
+        "Unmute": "UNMUTE TOGGLE",
+        "Previous": "PREV TRACK",
+        "Brightness": "BRIGHTNESS"
+    }
+
+    # Hand connections (same as MediaPipe) grouped into polylines per color;
+    # each connection keeps the color of its start landmark's finger
+    HAND_POLYLINES = (
+        # Thumb, plus the wrist-to-knuckle lines that start at landmark 0
+        (Colors.RED, ([0, 1, 2, 3, 4], [0, 5], [0, 9], [0, 13], [0, 17])),
+        # Index finger
+        (Colors.BLUE, ([5, 6, 7, 8], [5, 9])),
+        # Middle finger
+        (Colors.GREEN, ([9, 10, 11, 12], [9, 13])),
+        # Ring finger
+        (Colors.YELLOW, ([13, 14, 15, 16], [13, 17])),
+        # Pinky
+        (Colors.PURPLE, ([17, 18, 19, 20],)),
+    )
+
+    # (color, radius) per landmark: wrist, finger bases, finger tips, other joints
+    # Radii in half-resolution pixels (the skeleton is drawn at 0.5x scale)
+    LANDMARK_STYLES = tuple(
+        (Colors.WHITE, 3) if idx == 0 else
+        (Colors.CYAN, 3) if idx in (4, 8, 12, 16, 20) else
+        (Colors.ORANGE, 2) if idx in (1, 5, 9, 13, 17) else
+        (Colors.GRAY, 2)
+        for idx in range(21)
+    )
+    # Finger tip indices and labels
+    FINGER_TIP_INDICES = [4, 8, 12, 16, 20]
+    FINGER_TIP_LABELS = ("THUMB", "INDEX", "MIDDLE", "RING", "PINKY")
+
+    SKELETON_PAD = 4  # Largest landmark radius plus its border
+    # Aliased on purpose: LINE_AA is slower and its soft edges would not match the binary mask
+    SKELETON_LINE_TYPE = cv2.LINE_8
+    HELP_BORDER_PAD = 1  # Half the help overlay's border thickness
+
     def __init__(self):
         """Initialize UI display components"""
         self.pulse_animation = 0
-        self.last_pulse_time = time.time()
-        self.fps_history = []  # For performance metrics
+        self.last_pulse_time = time.monotonic_ns()
         self.max_fps_history = 30
+        self.fps_history = deque(maxlen=self.max_fps_history)  # For performance metrics
+        self._fps_count = 0
+        self._fps_min_window = deque()  # (index, fps) pairs with increasing fps
+        self._fps_sum = 0.0  # Running sum of fps_history
+
+        # Static volume bar chrome (borders, markers, labels), rendered once per geometry
+        self._bar_chrome = None
+        self._bar_chrome_key = None
+        # Fully composed volume bar (sprite, mask, x0, y0) and the state it was drawn for
+        self._bar_sprite = None
+        self._bar_sprite_key = None
+
+        # Half-resolution hand skeleton sprite + mask, reallocated on frame size change
+        self._skel_buf = None
+        self._skel_mask = None
+        # Last rendered skeleton: [(landmarks, sprite layer)] for the results object it came from
+        self._skel_hands = None
+        self._skel_shape = None
+        self._skel_layers = []
+
+        # Static help overlay text + border (sprite, mask), rendered on first use
+        self._help_sprite = None
+
+        self.reload_config()
+
+    def reload_config(self) -> None:
+        """
+        Snapshot the config values used while drawing
+        Call again after changing ui.* settings or colors at runtime
+        """
+        self._show_fps = config.get('ui.show_fps', True)
+        self._show_metrics = config.get('ui.show_performance_metrics', False)
+        self._bar_width = config.get('ui.volume_bar_width')
+        self._bar_height = config.get('ui.volume_bar_height')
+        self._bar_margin = config.get('ui.volume_bar_margin')
+        self._frame_skip = config.get('performance.frame_skip')
+        self._volume_color = config.get_color('gesture_volume')
+        self._gesture_colors = {
+            "Volume Control": self._volume_color,
+            "OK": config.get_color('gesture_ok'),
+            "Peace": config.get_color('gesture_peace'),
+            "Mute": config.get_color('gesture_mute'),
+            "Unmute": config.get_color('gesture_unmute'),  # Will default to white if not defined
+            "Previous": config.get_color('gesture_prev'),
+            "Brightness": config.get_color('gesture_brightness'),
+            "No Hand": Colors.GRAY,
+            "Unknown": Colors.GRAY
+        }
+
+        # Feedback labels are fixed: measure text and resolve colors once
+        self._feedback = {
+            gesture: (message,
+                      cv2.getTextSize(message, Fonts.FONT, Fonts.SCALE_MEDIUM, Fonts.THICKNESS_MEDIUM)[0],
+                      config.get_color(f'gesture_{gesture.lower()}'))
+            for gesture, message in self.FEEDBACK_MESSAGES.items()
+        }
+
+    @property
+    def avg_fps(self) -> float:
+        """Average FPS over the history window"""
+        return self._fps_sum / len(self.fps_history) if self.fps_history else 0
+
+    @property
+    def min_fps(self) -> float:
+        """Minimum FPS over the history window"""
+        return self._fps_min_window[0][1] if self._fps_min_window else 0
+
+    def _push_fps(self, fps: float) -> None:
+        """Add an FPS sample, keeping the window sum and minimum in O(1) amortized"""
+        history = self.fps_history
+        if len(history) == history.maxlen:
+            self._fps_sum -= history[0]
+        history.append(fps)
+        index = self._fps_count
+        self._fps_count += 1
+
+        # Resync the running sum now and then so float error cannot accumulate
+        if index & 1023 == 0:
+            self._fps_sum = sum(history)
+        else:
+            self._fps_sum += fps
+
+        window = self._fps_min_window
+        while window and window[-1][1] >= fps:
+            window.pop()
+        window.append((index, fps))
+        if window[0][0] <= index - self.max_fps_history:
+            window.popleft()
 
     def update_pulse_animation(self) -> float:
         """Update pulse animation for visual effects"""
-        current_time = time.time()
-        delta_time = current_time - self.last_pulse_time
+        current_time = time.monotonic_ns()
 
-        if delta_time > 0.05:  # 20 FPS animation
+        if current_time - self.last_pulse_time > 50_000_000:  # 20 FPS animation
             self.pulse_animation = (self.pulse_animation + 0.3) % (2 * math.pi)
             self.last_pulse_time = current_time
 
@@ -35,7 +212,7 @@ class UIDisplay:
 
     def draw_fps_display(self, img: np.ndarray, fps: float) -> None:
         """Draw FPS display with color coding"""
-        if not config.get('ui.show_fps', True):
+        if not self._show_fps:
             return
 
         # Color code FPS
@@ -47,49 +224,28 @@ class UIDisplay:
             fps_color = Colors.RED
 
         # Add to history for metrics
-        self.fps_history.append(fps)
-        if len(self.fps_history) > self.max_fps_history:
-            self.fps_history.pop(0)
+        self._push_fps(fps)
 
-        cv2.putText(img, f'FPS: {int(fps)}', UI.FPS_POSITION,
-                   Fonts.FONT, Fonts.SCALE_MEDIUM, fps_color, Fonts.THICKNESS_THIN)
+        self._put_text(img, f'FPS: {int(fps)}', UI.FPS_POSITION, Fonts.SCALE_MEDIUM, fps_color)
 
         # Show performance metrics if enabled
-        if config.get('ui.show_performance_metrics', False):
-            avg_fps = sum(self.fps_history) / len(self.fps_history) if self.fps_history else 0
-            min_fps = min(self.fps_history) if self.fps_history else 0
-            cv2.putText(img, f'Avg: {int(avg_fps)} Min: {int(min_fps)}',
-                       (10, UI.FPS_POSITION[1] + 25),
-                       Fonts.FONT, Fonts.SCALE_SMALL, Colors.GRAY, Fonts.THICKNESS_THIN)
+        if self._show_metrics:
+            self._put_text(img, f'Avg: {int(self.avg_fps)} Min: {int(self.min_fps)}',
+                           (10, UI.FPS_POSITION[1] + 25), Fonts.SCALE_SMALL, Colors.GRAY)
 
     def draw_volume_display(self, img: np.ndarray, volume: int, smooth_bar) -> None:
         """Draw volume percentage display"""
-        volume_color = config.get_color('gesture_volume')
-        cv2.putText(img, f'Volume: {volume}%', UI.VOLUME_POSITION,
-                   Fonts.FONT, Fonts.SCALE_MEDIUM, volume_color, Fonts.THICKNESS_THIN)
+        self._put_text(img, f'Volume: {volume}%', UI.VOLUME_POSITION,
+                       Fonts.SCALE_MEDIUM, self._volume_color)
 
     def draw_gesture_status(self, img: np.ndarray, gesture: str) -> None:
         """Draw current gesture status with color coding"""
-        gesture_colors = {
-            "Volume Control": config.get_color('gesture_volume'),
-            "OK": config.get_color('gesture_ok'),
-            "Peace": config.get_color('gesture_peace'),
-            "Mute": config.get_color('gesture_mute'),
-            "Unmute": config.get_color('gesture_unmute'),  # Will default to white if not defined
-            "Previous": config.get_color('gesture_prev'),
-            "Brightness": config.get_color('gesture_brightness'),
-            "No Hand": Colors.GRAY,
-            "Unknown": Colors.GRAY
-        }
-
-        color = gesture_colors.get(gesture, Colors.WHITE)
-        cv2.putText(img, f'Gesture: {gesture}', UI.GESTURE_POSITION,
-                   Fonts.FONT, Fonts.SCALE_MEDIUM, color, Fonts.THICKNESS_THIN)
+        color = self._gesture_colors.get(gesture, Colors.WHITE)
+        self._put_text(img, f'Gesture: {gesture}', UI.GESTURE_POSITION, Fonts.SCALE_MEDIUM, color)
 
     def draw_status_info(self, img: np.ndarray, status_text: str) -> None:
         """Draw status information at bottom of screen"""
-        cv2.putText(img, status_text, UI.STATUS_POSITION,
-                   Fonts.FONT, Fonts.SCALE_SMALL, Colors.GRAY, Fonts.THICKNESS_THIN)
+        self._put_text(img, status_text, UI.STATUS_POSITION, Fonts.SCALE_SMALL, Colors.GRAY)
 
     def draw_volume_control_info(self, img: np.ndarray, distance: float, volume: int) -> None:
         """Draw detailed volume control information"""
@@ -106,10 +262,10 @@ class UIDisplay:
                      Colors.GRAY, 1)
 
         # Info text
+        # Raw distance changes nearly every frame: not worth caching
         cv2.putText(img, f'Dist: {int(distance)}px', (info_x, info_y),
                    Fonts.FONT, Fonts.SCALE_SMALL, Colors.BLUE, Fonts.THICKNESS_THIN)
-        cv2.putText(img, f'Vol: {volume}%', (info_x, info_y + 20),
-                   Fonts.FONT, Fonts.SCALE_SMALL, Colors.BLUE, Fonts.THICKNESS_THIN)
+        self._put_text(img, f'Vol: {volume}%', (info_x, info_y + 20), Fonts.SCALE_SMALL, Colors.BLUE)
 
         # Add pulse effect
         pulse_scale = 0.8 + 0.2 * math.sin(self.pulse_animation)
@@ -120,18 +276,9 @@ class UIDisplay:
 
     def draw_gesture_feedback(self, img: np.ndarray, gesture: str, center_position: Tuple[int, int]) -> None:
         """Draw visual feedback for gesture activation"""
-        feedback_messages = {
-            "OK": "PLAY/PAUSE",
-            "Peace": "NEXT TRACK",
-            "Mute": "MUTE TOGGLE",
-            "Unmute": "UNMUTE TOGGLE",
-            "Previous": "PREV TRACK",
-            "Brightness": "BRIGHTNESS"
-        }
-
-        if gesture in feedback_messages:
-            message = feedback_messages[gesture]
-            text_size = cv2.getTextSize(message, Fonts.FONT, Fonts.SCALE_MEDIUM, Fonts.THICKNESS_MEDIUM)[0]
+        feedback = self._feedback.get(gesture)
+        if feedback is not None:
+            message, text_size, gesture_color = feedback
 
             # Center the message
             text_x = (img.shape[1] - text_size[0]) // 2
@@ -144,14 +291,13 @@ class UIDisplay:
                          Colors.BLACK, -1)
 
             # Border with gesture color
-            gesture_color = config.get_color(f'gesture_{gesture.lower()}')
             cv2.rectangle(img, (text_x - padding, text_y - 25),
                          (text_x + text_size[0] + padding, text_y + 5),
                          gesture_color, 2)
 
             # Text
-            cv2.putText(img, message, (text_x, text_y),
-                       Fonts.FONT, Fonts.SCALE_MEDIUM, gesture_color, Fonts.THICKNESS_MEDIUM)
+            self._put_text(img, message, (text_x, text_y),
+                           Fonts.SCALE_MEDIUM, gesture_color, Fonts.THICKNESS_MEDIUM)
 
     def draw_animated_volume_bar(self, img: np.ndarray, display_volume: int,
                                target_volume: int, pulse_animation: float) -> None:
@@ -159,98 +305,145 @@ class UIDisplay:
         h, w, _ = img.shape
 
         # Volume bar dimensions
-        bar_width = config.get('ui.volume_bar_width')
-        bar_height = config.get('ui.volume_bar_height')
-        margin = config.get('ui.volume_bar_margin')
+        bar_width = self._bar_width
+        bar_height = self._bar_height
+        margin = self._bar_margin
 
         bar_x = margin
         bar_y = (h - bar_height) // 2
 
-        # Background bar with subtle gradient
-        for i in range(bar_height):
-            ratio = i / bar_height
-            intensity = int(255 * (0.2 + 0.1 * ratio))  # Subtle gradient
-            cv2.line(img, (bar_x, bar_y + i), (bar_x + bar_width, bar_y + i),
-                    (intensity, intensity, intensity), 1)
+        # Volume fill height, clamped to the bar
+        fill_height = max(0, min(bar_height, int((display_volume / 100) * bar_height)))
 
-        # Volume fill with gradient colors
-        fill_height = int((display_volume / 100) * bar_height)
-        fill_y = bar_y + (bar_height - fill_height)
+        # Static chrome: 3D border, percentage markers and labels, rendered once per geometry
+        key = (bar_x, bar_y, bar_width, bar_height)
+        if self._bar_chrome_key != key:
+            self._bar_chrome = self._render_bar_chrome(*key)
+            self._bar_chrome_key = key
 
+        # Target volume indicator (pulsing when different from display)
+        target = None
+        if abs(display_volume - target_volume) > 2:
+            target_height = bar_y + bar_height - int((target_volume / 100) * bar_height)
+            pulse_scale = 0.8 + 0.2 * math.sin(pulse_animation)
+            pulse_size = max(1, int(VolumeBar.PULSE_SIZE * pulse_scale))
+            target = (target_height, pulse_size)
+
+        # The bar's pixels depend only on these values - recompose it only when one changes
+        high = display_volume >= 50
+        bar_key = (key, fill_height, high, target)
+        if self._bar_sprite_key != bar_key:
+            self._bar_sprite = self._render_bar(bar_x, bar_y, bar_width, bar_height,
+                                                fill_height, high, target)
+            self._bar_sprite_key = bar_key
+        self._blit_sprite(img, *self._bar_sprite)
+
+    def _render_bar(self, bar_x: int, bar_y: int, bar_width: int, bar_height: int, fill_height: int,
+                    high: bool, target: Optional[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray, int, int]:
+        """
+        Compose the whole volume bar - background and fill rows, chrome and
+        indicators - into a sprite + mask pair at the chrome's position
+        """
+        chrome, chrome_mask, x0, y0 = self._bar_chrome
+        sprite = np.zeros_like(chrome)
+        mask = chrome_mask.copy()
+        bx, by = bar_x - x0, bar_y - y0
+
+        # Background above the fill, gradient + highlight fill below: every bar row is
+        # written once from cached columns broadcast across the bar width
+        # (bar_x..bar_x + bar_width inclusive, as the old per-row lines drew)
+        fill_y = by + bar_height - fill_height
+        sprite[by:fill_y, bx:bx + bar_width + 1] = _background_gradient(bar_height)[:bar_height - fill_height]
         if fill_height > 0:
-            for i in range(fill_height):
-                ratio = i / fill_height if fill_height > 0 else 0
-                height_pos = fill_y + i
-
-                # Color gradient based on volume level
-                if display_volume < 50:
-                    # Green to yellow gradient
-                    green = 255
-                    red = int(255 * (ratio * 2))
-                    blue = 0
-                else:
-                    # Yellow to red gradient
-                    green = int(255 * (1 - (ratio - 0.5) * 2))
-                    red = 255
-                    blue = 0
-
-                color = (blue, green, red)
-                cv2.line(img, (bar_x, height_pos), (bar_x + bar_width, height_pos), color, 1)
-
-        # Highlight effect on top
+            sprite[fill_y:by + bar_height, bx:bx + bar_width + 1] = _fill_gradient(fill_height, high)
+        mask[by:by + bar_height, bx:bx + bar_width + 1] = 255
+
+        # Chrome on top of the rows
+        cv2.copyTo(chrome, chrome_mask, sprite)
+
+        # Target volume indicator line
+        if target is not None:
+            target_height, pulse_size = target
+            ty = target_height - y0
+            cv2.line(sprite, (bx - 5, ty), (bx + bar_width + 5, ty), Colors.WHITE, pulse_size)
+            cv2.line(mask, (bx - 5, ty), (bx + bar_width + 5, ty), 255, pulse_size)
+
+        # Current volume indicator (circle at the top)
         if fill_height > 0:
-            highlight_height = max(3, int(fill_height * VolumeBar.HIGHLIGHT_HEIGHT_RATIO))
-            for i in range(highlight_height):
-                alpha = 1.0 - (i / highlight_height)
-                highlight_color = (int(255 * alpha), int(255 * alpha), int(255 * alpha))
-                pos = fill_y + i
-                if pos < bar_y + bar_height:
-                    cv2.line(img, (bar_x, pos), (bar_x + bar_width, pos), highlight_color, 1)
+            center = (bx + bar_width // 2, fill_y)
+            indicator_radius = 4
+            cv2.circle(sprite, center, indicator_radius, Colors.WHITE, -1)
+            cv2.circle(sprite, center, indicator_radius, Colors.BLACK, 1)
+            cv2.circle(mask, center, indicator_radius, 255, -1)
+            cv2.circle(mask, center, indicator_radius, 255, 1)
+
+        return sprite, mask, x0, y0
+
+    def _render_bar_chrome(self, bar_x: int, bar_y: int, bar_width: int,
+                           bar_height: int) -> Tuple[np.ndarray, np.ndarray, int, int]:
+        """
+        Render the volume bar's static border, markers and labels into a
+        sprite + mask pair positioned at (x0, y0) in frame coordinates
+        """
+        (label_w, label_h), baseline = cv2.getTextSize('100%', Fonts.FONT, Fonts.SCALE_SMALL,
+                                                       Fonts.THICKNESS_THIN)
+        marker_max = max(VolumeBar.MARKER_LENGTH_MAJOR, VolumeBar.MARKER_LENGTH_MINOR)
+        pad = VolumeBar.BORDER_THICKNESS + 1
+        x0 = bar_x - marker_max - pad
+        y0 = bar_y - max(label_h, 1) - pad
+        x1 = bar_x + bar_width + max(10 + label_w, marker_max) + pad
+        y1 = bar_y + bar_height + 5 + baseline + pad
+        sprite = np.zeros((y1 - y0, x1 - x0, 3), np.uint8)
+        mask = np.zeros((y1 - y0, x1 - x0), np.uint8)
+        bx, by = bar_x - x0, bar_y - y0
+
+        def draw(func, *args, color, **kwargs):
+            # Same primitive into the sprite and the mask
+            func(sprite, *args, color, **kwargs)
+            func(mask, *args, 255, **kwargs)
 
         # 3D border effect
-        cv2.rectangle(img, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height),
-                     Colors.GRAY, VolumeBar.BORDER_THICKNESS)
-        cv2.rectangle(img, (bar_x - 1, bar_y - 1),
-                     (bar_x + bar_width + 1, bar_y + bar_height + 1),
-                     Colors.DARK_GRAY, VolumeBar.BORDER_THICKNESS)
+        draw(cv2.rectangle, (bx, by), (bx + bar_width, by + bar_height),
+             color=Colors.GRAY, thickness=VolumeBar.BORDER_THICKNESS)
+        draw(cv2.rectangle, (bx - 1, by - 1), (bx + bar_width + 1, by + bar_height + 1),
+             color=Colors.DARK_GRAY, thickness=VolumeBar.BORDER_THICKNESS)
 
         # Percentage markers
         for percent in [0, 25, 50, 75, 100]:
-            marker_y = bar_y + bar_height - int((percent / 100) * bar_height)
+            marker_y = by + bar_height - int((percent / 100) * bar_height)
             marker_color = Colors.WHITE if percent % 50 == 0 else Colors.GRAY
             marker_length = VolumeBar.MARKER_LENGTH_MAJOR if percent % 50 == 0 else VolumeBar.MARKER_LENGTH_MINOR
 
             # Left markers
-            cv2.line(img, (bar_x - marker_length, marker_y), (bar_x, marker_y),
-                    marker_color, 1)
+            draw(cv2.line, (bx - marker_length, marker_y), (bx, marker_y), color=marker_color, thickness=1)
             # Right markers
-            cv2.line(img, (bar_x + bar_width, marker_y),
-                    (bar_x + bar_width + marker_length, marker_y),
-                    marker_color, 1)
+            draw(cv2.line, (bx + bar_width, marker_y), (bx + bar_width + marker_length, marker_y),
+                 color=marker_color, thickness=1)
 
             # Text labels for major markers
             if percent % 50 == 0:
-                cv2.putText(img, f'{percent}%',
-                           (bar_x + bar_width + 10, marker_y + 5),
-                           Fonts.FONT, Fonts.SCALE_SMALL, Colors.GRAY, Fonts.THICKNESS_THIN)
+                draw(cv2.putText, f'{percent}%', (bx + bar_width + 10, marker_y + 5),
+                     Fonts.FONT, Fonts.SCALE_SMALL, color=Colors.GRAY, thickness=Fonts.THICKNESS_THIN)
 
-        # Target volume indicator (pulsing when different from display)
-        if abs(display_volume - target_volume) > 2:
-            target_height = bar_y + bar_height - int((target_volume / 100) * bar_height)
-            pulse_scale = 0.8 + 0.2 * math.sin(pulse_animation)
-            pulse_size = max(1, int(VolumeBar.PULSE_SIZE * pulse_scale))
+        return sprite, mask, x0, y0
 
-            cv2.line(img, (bar_x - 5, target_height), (bar_x + bar_width + 5, target_height),
-                    Colors.WHITE, pulse_size)
+    @staticmethod
+    def _blit_sprite(img: np.ndarray, sprite: np.ndarray, mask: np.ndarray, x0: int, y0: int) -> None:
+        """Copy the masked pixels of a sprite into img at (x0, y0), clipped to the frame"""
+        h, w = img.shape[:2]
+        sh, sw = sprite.shape[:2]
+        sx0, sy0 = max(0, -x0), max(0, -y0)
+        sx1, sy1 = min(sw, w - x0), min(sh, h - y0)
+        if sx0 >= sx1 or sy0 >= sy1:
+            return
+        roi = img[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1]
+        cv2.copyTo(sprite[sy0:sy1, sx0:sx1], mask[sy0:sy1, sx0:sx1], roi)
 
-        # Current volume indicator (circle at the top)
-        if fill_height > 0:
-            current_height = bar_y + bar_height - fill_height
-            indicator_radius = 4
-            cv2.circle(img, (bar_x + bar_width // 2, current_height),
-                      indicator_radius, Colors.WHITE, -1)
-            cv2.circle(img, (bar_x + bar_width // 2, current_height),
-                      indicator_radius, Colors.BLACK, 1)
+    def _put_text(self, img: np.ndarray, text: str, org: Tuple[int, int], font_scale: float,
+                  color: Tuple[int, int, int], thickness: int = Fonts.THICKNESS_THIN) -> None:
+        """Same output as cv2.putText, but blits a cached rendering of the string"""
+        sprite, mask, dx, dy = _text_sprite(text, font_scale, color, thickness)
+        self._blit_sprite(img, sprite, mask, org[0] + dx, org[1] + dy)
 
     def draw_help_overlay(self, img: np.ndarray, show_help: bool = False) -> None:
         """Draw help overlay with gesture instructions"""
@@ -263,12 +456,26 @@ class UIDisplay:
         overlay_x = (w - overlay_width) // 2
         overlay_y = (h - overlay_height) // 2
 
-        # Semi-transparent background
-        overlay = img.copy()
-        cv2.rectangle(overlay, (overlay_x, overlay_y),
-                     (overlay_x + overlay_width, overlay_y + overlay_height),
-                     (0, 0, 0), -1)
-        cv2.addWeighted(img, 0.7, overlay, 0.3, 0, img)
+        # Semi-transparent background: darken the (inclusive) overlay rectangle in place
+        roi = img[max(0, overlay_y):overlay_y + overlay_height + 1,
+                  max(0, overlay_x):overlay_x + overlay_width + 1]
+        cv2.convertScaleAbs(roi, roi, 0.7)
+
+        # Help content and border, rendered once
+        if self._help_sprite is None:
+            self._help_sprite = self._render_help_sprite(overlay_width, overlay_height)
+        sprite, mask = self._help_sprite
+        pad = self.HELP_BORDER_PAD
+        self._blit_sprite(img, sprite, mask, overlay_x - pad, overlay_y - pad)
+
+    def _render_help_sprite(self, overlay_width: int, overlay_height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Render the help text and border into a sprite + mask pair, offset by
+        HELP_BORDER_PAD so the border's outer half fits inside the sprite
+        """
+        pad = self.HELP_BORDER_PAD
+        sprite = np.zeros((overlay_height + 2 * pad + 1, overlay_width + 2 * pad + 1, 3), np.uint8)
+        mask = np.zeros(sprite.shape[:2], np.uint8)
 
         # Help content
         help_lines = [
@@ -284,20 +491,24 @@ class UIDisplay:
             "Press 'H' to hide, 'Q' to quit"
         ]
 
-        y_offset = overlay_y + 30
+        y_offset = pad + 30
         for line in help_lines:
-            cv2.putText(img, line, (overlay_x + 20, y_offset),
+            cv2.putText(sprite, line, (pad + 20, y_offset),
                        Fonts.FONT, Fonts.SCALE_SMALL, Colors.WHITE, Fonts.THICKNESS_THIN)
+            cv2.putText(mask, line, (pad + 20, y_offset),
+                       Fonts.FONT, Fonts.SCALE_SMALL, 255, Fonts.THICKNESS_THIN)
             y_offset += 20
 
         # Border
-        cv2.rectangle(img, (overlay_x, overlay_y),
-                     (overlay_x + overlay_width, overlay_y + overlay_height),
-                     Colors.WHITE, 2)
+        corners = (pad, pad), (pad + overlay_width, pad + overlay_height)
+        cv2.rectangle(sprite, *corners, Colors.WHITE, 2)
+        cv2.rectangle(mask, *corners, 255, 2)
+
+        return sprite, mask
 
     def draw_performance_overlay(self, img: np.ndarray, metrics: dict) -> None:
         """Draw performance metrics overlay"""
-        if not config.get('ui.show_performance_metrics', False):
+        if not self._show_metrics:
             return
 
         h, w = img.shape[:2]
@@ -314,20 +525,24 @@ class UIDisplay:
                      (overlay_x + overlay_width, overlay_y + overlay_height),
                      Colors.GRAY, 1)
 
-        # Performance metrics
+        # Performance metrics: (text, cacheable) - the float readouts change every
+        # frame and would only churn the text sprite cache, so they use putText
         metrics_lines = [
-            "PERFORMANCE:",
-            f"FPS: {metrics.get('fps', 0):.1f}",
-            f"Avg FPS: {metrics.get('avg_fps', 0):.1f}",
-            f"Min FPS: {metrics.get('min_fps', 0):.1f}",
-            f"Frame Skip: {config.get('performance.frame_skip')}",
-            f"CPU: {metrics.get('cpu_usage', 'N/A')}%"
+            ("PERFORMANCE:", True),
+            (f"FPS: {metrics.get('fps', 0):.1f}", False),
+            (f"Avg FPS: {metrics.get('avg_fps', 0):.1f}", False),
+            (f"Min FPS: {metrics.get('min_fps', 0):.1f}", False),
+            (f"Frame Skip: {self._frame_skip}", True),
+            (f"CPU: {metrics.get('cpu_usage', 'N/A')}%", True)
         ]
 
         y_offset = overlay_y + 25
-        for line in metrics_lines:
-            cv2.putText(img, line, (overlay_x + 10, y_offset),
-                       Fonts.FONT, Fonts.SCALE_SMALL, Colors.WHITE, Fonts.THICKNESS_THIN)
+        for line, cacheable in metrics_lines:
+            if cacheable:
+                self._put_text(img, line, (overlay_x + 10, y_offset), Fonts.SCALE_SMALL, Colors.WHITE)
+            else:
+                cv2.putText(img, line, (overlay_x + 10, y_offset),
+                           Fonts.FONT, Fonts.SCALE_SMALL, Colors.WHITE, Fonts.THICKNESS_THIN)
             y_offset += 20
 
     def draw_hand_skeleton(self, img: np.ndarray, detector) -> None:
@@ -337,135 +552,105 @@ class UIDisplay:
 
         # Always draw hand landmarks if available (not just on processed frames)
         if detector.results and detector.results.multi_hand_landmarks:
-            for hand_landmarks in detector.results.multi_hand_landmarks:
-                # Scale landmarks back to original image size (since detector processes at 0.5 scale)
-                scaled_landmarks = self._scale_landmarks_for_display(hand_landmarks, img.shape)
-
-                # Draw connections between landmarks
-                self._draw_hand_connections(img, scaled_landmarks)
-
-                # Draw landmark points
-                self._draw_hand_landmarks(img, scaled_landmarks)
-
-                # Draw finger labels for better understanding
-                self._draw_finger_labels(img, scaled_landmarks)
-
-    def _draw_hand_connections(self, img: np.ndarray, hand_landmarks) -> None:
-        """Draw connections between hand landmarks"""
-        h, w, _ = img.shape
-
-        # Define hand connections (same as MediaPipe)
-        connections = [
-            # Thumb
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # Index finger
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # Middle finger
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # Ring finger
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # Pinky
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # Palm connections
-            (5, 9), (9, 13), (13, 17)
-        ]
-
-        for connection in connections:
-            start_idx, end_idx = connection
-            start_landmark = hand_landmarks.landmark[start_idx]
-            end_landmark = hand_landmarks.landmark[end_idx]
-
-            start_point = (int(start_landmark.x), int(start_landmark.y))
-            end_point = (int(end_landmark.x), int(end_landmark.y))
-
-            # Color code connections by finger
-            if start_idx in [0, 1, 2, 3, 4]:  # Thumb
-                color = Colors.RED
-            elif start_idx in [5, 6, 7, 8]:  # Index
-                color = Colors.BLUE
-            elif start_idx in [9, 10, 11, 12]:  # Middle
-                color = Colors.GREEN
-            elif start_idx in [13, 14, 15, 16]:  # Ring
-                color = Colors.YELLOW
-            else:  # Pinky and palm
-                color = Colors.PURPLE
-
-            cv2.line(img, start_point, end_point, color, 2)
-
-    def _draw_hand_landmarks(self, img: np.ndarray, hand_landmarks) -> None:
+            hands = detector.results.multi_hand_landmarks
+
+            # Frames the detector skipped keep the same results object - reuse the render
+            if hands is not self._skel_hands or img.shape != self._skel_shape:
+                self._skel_layers = []
+                for hand_landmarks in hands:
+                    # Scale landmarks back to original image size (since detector processes at 0.5 scale)
+                    landmarks = self._landmarks_to_array(hand_landmarks, img.shape)
+                    self._skel_layers.append((landmarks, self._render_skeleton_half_res(img.shape, landmarks)))
+                self._skel_hands = hands
+                self._skel_shape = img.shape
+
+            for landmarks, layer in self._skel_layers:
+                # Draw connections and landmark points
+                if layer is not None:
+                    self._blit_sprite(img, *layer)
+
+                # Draw finger labels for better understanding (full resolution for legible text)
+                self._draw_finger_labels(img, landmarks)
+
+    def _render_skeleton_half_res(self, img_shape, landmarks: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray, int, int]]:
+        """
+        Draw the hand skeleton into a half-resolution sprite covering the hand's
+        bounding box, then upscale it - a quarter of the pixels touched.
+        Returns (sprite, mask, x0, y0) in frame coordinates, or None if the hand is off-frame
+        """
+        h, w = img_shape[:2]
+        half_h, half_w = (h + 1) // 2, (w + 1) // 2
+        if self._skel_buf is None or self._skel_buf.shape[:2] != (half_h, half_w):
+            self._skel_buf = np.zeros((half_h, half_w, 3), np.uint8)
+            self._skel_mask = np.zeros((half_h, half_w), np.uint8)
+
+        points = (landmarks[:, :2] * 0.5).astype(np.int32)
+        x0, y0 = np.maximum(points.min(axis=0) - self.SKELETON_PAD, 0).tolist()
+        x1, y1 = np.minimum(points.max(axis=0) + self.SKELETON_PAD + 1, (half_w, half_h)).tolist()
+        if x0 >= x1 or y0 >= y1:
+            return None  # Hand entirely outside the frame
+
+        # Only the bounding box is cleared and drawn into
+        sprite = self._skel_buf[y0:y1, x0:x1]
+        mask = self._skel_mask[y0:y1, x0:x1]
+        sprite.fill(0)
+        mask.fill(0)
+        points -= (x0, y0)
+
+        self._draw_hand_connections(sprite, mask, points)
+        self._draw_hand_landmarks(sprite, mask, points)
+
+        # resize allocates fresh arrays, so the result can be kept across frames
+        sprite = cv2.resize(sprite, None, fx=2, fy=2, interpolation=cv2.INTER_NEAREST)
+        mask = cv2.resize(mask, None, fx=2, fy=2, interpolation=cv2.INTER_NEAREST)
+        return sprite, mask, 2 * x0, 2 * y0
+
+    def _draw_hand_connections(self, sprite: np.ndarray, mask: np.ndarray, points: np.ndarray) -> None:
+        """Draw connections between hand landmarks, one polylines call per finger color"""
+        for color, chains in self.HAND_POLYLINES:
+            lines = [points[chain] for chain in chains]
+            cv2.polylines(sprite, lines, False, color, 1, self.SKELETON_LINE_TYPE)
+            cv2.polylines(mask, lines, False, 255, 1, self.SKELETON_LINE_TYPE)
+
+    def _draw_hand_landmarks(self, sprite: np.ndarray, mask: np.ndarray, points: np.ndarray) -> None:
         """Draw hand landmark points"""
-        h, w, _ = img.shape
-
-        for idx, landmark in enumerate(hand_landmarks.landmark):
-            x, y = int(landmark.x), int(landmark.y)
-
-            # Different colors for different landmark types
-            if idx == 0:  # Wrist
-                color = Colors.WHITE
-                radius = 6
-            elif idx in [4, 8, 12, 16, 20]:  # Finger tips
-                color = Colors.CYAN
-                radius = 5
-            elif idx in [1, 5, 9, 13, 17]:  # Finger bases
-                color = Colors.ORANGE
-                radius = 4
-            else:  # Other joints
-                color = Colors.GRAY
-                radius = 3
-
-            cv2.circle(img, (x, y), radius, color, -1)
-            cv2.circle(img, (x, y), radius, Colors.BLACK, 1)  # Border
-
-    def _scale_landmarks_for_display(self, hand_landmarks, img_shape):
-        """Scale landmarks back to original image size for display"""
+        for (x, y), (color, radius) in zip(points.tolist(), self.LANDMARK_STYLES):
+            cv2.circle(sprite, (x, y), radius, color, -1, self.SKELETON_LINE_TYPE)
+            cv2.circle(sprite, (x, y), radius, Colors.BLACK, 1, self.SKELETON_LINE_TYPE)  # Border
+            cv2.circle(mask, (x, y), radius, 255, -1, self.SKELETON_LINE_TYPE)
+            cv2.circle(mask, (x, y), radius, 255, 1, self.SKELETON_LINE_TYPE)
+
+    def _landmarks_to_array(self, hand_landmarks, img_shape) -> np.ndarray:
+        """Landmarks as a (21, 3) float32 array with x, y scaled to image pixels"""
         h, w = img_shape[:2]
-
-        # Create a copy of the landmarks with scaled coordinates
-        scaled_landmarks = []
-        for landmark in hand_landmarks.landmark:
-            scaled_x = landmark.x * w
-            scaled_y = landmark.y * h
-            scaled_z = landmark.z  # z coordinate doesn't need scaling for display
-            scaled_landmarks.append(type('ScaledLandmark', (), {
-                'x': scaled_x,
-                'y': scaled_y,
-                'z': scaled_z
-            })())
-
-        # Return object with landmark attribute
-        return type('ScaledHandLandmarks', (), {'landmark': scaled_landmarks})()
-
-    def _draw_finger_labels(self, img: np.ndarray, hand_landmarks) -> None:
+        landmarks = np.fromiter(
+            (c for lm in hand_landmarks.landmark for c in (lm.x, lm.y, lm.z)),
+            dtype=np.float32, count=63
+        ).reshape(21, 3)
+        landmarks[:, 0] *= w
+        landmarks[:, 1] *= h  # z coordinate doesn't need scaling for display
+        return landmarks
+
+    def _draw_finger_labels(self, img: np.ndarray, landmarks: np.ndarray) -> None:
         """Draw finger labels for educational purposes"""
         h, w, _ = img.shape
 
         # Calculate hand size for dynamic scaling
-        wrist = hand_landmarks.landmark[0]
-        middle_finger_tip = hand_landmarks.landmark[12]
-        hand_width = abs(middle_finger_tip.x - wrist.x)
-        hand_height = abs(middle_finger_tip.y - wrist.y)
+        wrist_x, wrist_y = float(landmarks[0, 0]), float(landmarks[0, 1])
+        hand_width = abs(float(landmarks[12, 0]) - wrist_x)
+        hand_height = abs(float(landmarks[12, 1]) - wrist_y)
         hand_size = max(hand_width, hand_height)
 
         # Dynamic font scale based on hand size
         font_scale = max(0.3, min(0.6, hand_size / 200))
         font_thickness = max(1, int(font_scale * 3))
 
-        # Finger tip indices and labels
-        finger_tips = {
-            4: "THUMB",
-            8: "INDEX",
-            12: "MIDDLE",
-            16: "RING",
-            20: "PINKY"
-        }
+        tips = landmarks[self.FINGER_TIP_INDICES, :2].astype(np.int32).tolist()
 
-        for tip_idx, label in finger_tips.items():
-            landmark = hand_landmarks.landmark[tip_idx]
-            x, y = int(landmark.x), int(landmark.y)
+        for (x, y), label in zip(tips, self.FINGER_TIP_LABELS):
 
             # Position label dynamically based on hand orientation
             # Check if hand is pointing up or down
-            wrist_y = wrist.y
             hand_direction = "up" if y < wrist_y else "down"
 
             if hand_direction == "up":
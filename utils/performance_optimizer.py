@@ -14,18 +14,29 @@ class PerformanceOptimizer:
     def __init__(self):
         self.frame_skip = config.get('performance.frame_skip')
         self.frame_count = 0
-        self.last_volume_update = 0
+        # frame_skip 1 berarti semua frame diproses; pangkat dua pakai bitmask
+        self._always_process = self.frame_skip == 1
+        self._frame_skip_mask = (self.frame_skip - 1
+                                 if self.frame_skip & (self.frame_skip - 1) == 0
+                                 else None)
         self.volume_update_interval = config.get('performance.volume_update_interval')
+        # Timestamp dalam nanodetik integer (monotonic, aman dari lompatan jam)
+        self._volume_update_interval_ns = int(self.volume_update_interval * 1e9)
+        self.last_volume_update = time.monotonic_ns() - self._volume_update_interval_ns
 
     def should_process_frame(self) -> bool:
         """Decision apakah frame ini harus diproses"""
+        if self._always_process:
+            return True
         self.frame_count += 1
+        if self._frame_skip_mask is not None:
+            return self.frame_count & self._frame_skip_mask == 0
         return self.frame_count % self.frame_skip == 0
 
     def should_update_volume(self) -> bool:
         """Decision apakah volume harus diupdate"""
-        current_time = time.time()
-        if current_time - self.last_volume_update > self.volume_update_interval:
+        current_time = time.monotonic_ns()
+        if current_time - self.last_volume_update > self._volume_update_interval_ns:
             self.last_volume_update = current_time
             return True
         return False